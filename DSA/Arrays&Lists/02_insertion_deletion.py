@@ -36,6 +36,142 @@ arr[insert_pos] = 5
 print("After inserting 5 at index 0:", arr)
 # Output: [5, 10, 20, 30, 40]
 
+# ============================================================================
+# MILLIONS OF MIDDLE INSERTS: BLOCKED LIST
+# ============================================================================
+"""
+Problem: every middle insert/delete shifts ~n/2 elements → O(n) each
+Idea: split the list into small blocks, only ONE block shifts
+
+    [10, 20, 30, 40, 50, 60, 70, 80]
+    → blocks: [10, 20, 30] [40, 50, 60] [70, 80]
+
+    insert 45 at index 4 → only [40, 50, 60] changes → [40, 45, 50, 60]
+
+Finding the block for an index: a Fenwick tree over the block lengths
+("how many elements before block b?") → O(log B) instead of scanning.
+Blocks hold at most 2 × block_size items; a full block splits in two,
+an empty block is dropped (both rebuild the index: O(B), but rarely).
+
+Insert / delete / index: O(log B + block_size), block_size ≈ √n
+"""
+
+class BlockList:
+    """
+    List of bounded blocks with a position index
+
+    List-like: len, iteration, ==, indexing, slice reads (→ new BlockList),
+    item assignment, insert, append, pop and del by index.
+    Slice assignment / deletion are not supported.
+    """
+    def __init__(self, iterable=(), block_size=1024):
+        self.block_size = block_size
+        items = list(iterable)
+        self.blocks = [items[i:i + block_size] for i in range(0, len(items), block_size)] or [[]]
+        self.size = len(items)
+        self.rebuild_index()
+
+    def rebuild_index(self):
+        """Fenwick tree over block lengths, built in O(B)"""
+        count = len(self.blocks)
+        tree = [0] * (count + 1)
+        for i, block in enumerate(self.blocks, 1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent <= count:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.top = 1 << (count.bit_length() - 1) if count else 0
+
+    def add_length(self, block_index, delta):
+        i = block_index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def locate(self, index):
+        """(block, offset) of element `index`: descend the Fenwick tree"""
+        pos, remaining, step = 0, index, self.top
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= remaining:
+                pos = nxt
+                remaining -= self.tree[nxt]
+            step >>= 1
+        return pos, remaining
+
+    def check_index(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("BlockList index out of range")
+        return index
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return BlockList(list(self)[index], self.block_size)
+        block, offset = self.locate(self.check_index(index))
+        return self.blocks[block][offset]
+
+    def __setitem__(self, index, value):
+        block, offset = self.locate(self.check_index(index))
+        self.blocks[block][offset] = value
+
+    def insert(self, index, value):
+        """Insert before index (like list.insert, index clamped)"""
+        if index < 0:
+            index = max(0, index + self.size)
+        index = min(index, self.size)
+
+        if index == self.size:
+            block, offset = len(self.blocks) - 1, len(self.blocks[-1])
+        else:
+            block, offset = self.locate(index)
+        self.blocks[block].insert(offset, value)
+        self.size += 1
+
+        if len(self.blocks[block]) > 2 * self.block_size:
+            full = self.blocks[block]
+            half = len(full) // 2
+            self.blocks[block:block + 1] = [full[:half], full[half:]]
+            self.rebuild_index()
+        else:
+            self.add_length(block, 1)
+
+    def append(self, value):
+        self.insert(self.size, value)
+
+    def pop(self, index=-1):
+        index = self.check_index(index)
+        block, offset = self.locate(index)
+        value = self.blocks[block].pop(offset)
+        self.size -= 1
+
+        if not self.blocks[block] and len(self.blocks) > 1:
+            del self.blocks[block]
+            self.rebuild_index()
+        else:
+            self.add_length(block, -1)
+        return value
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block
+
+    def __eq__(self, other):
+        if not isinstance(other, (BlockList, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"BlockList({list(self)})"
+
 # ============================================================================
 # GENERIC INSERTION FUNCTION
 # ============================================================================
@@ -49,12 +185,17 @@ def insert_at_position(arr, element, position):
         element: Value to insert
         position: Index where to insert
     
-    Time: O(n), Space: O(1)
+    Time: O(n) for a list, Space: O(1)
+    BlockList: O(log B + block_size) (only one block shifts)
     """
     if position < 0 or position > len(arr):
         print("Invalid position!")
         return arr
     
+    if isinstance(arr, BlockList):  # (above) only one block shifts
+        arr.insert(position, element)
+        return arr
+    
     arr.append(0)  # Make space
     size = len(arr)
     
@@ -113,12 +254,17 @@ def delete_at_position(arr, position):
         arr: The list
         position: Index to delete
     
-    Time: O(n), Space: O(1)
+    Time: O(n) for a list, Space: O(1)
+    BlockList: O(log B + block_size) (only one block shifts)
     """
     if position < 0 or position >= len(arr):
         print("Invalid position!")
         return arr
     
+    if isinstance(arr, BlockList):  # (above) only one block shifts
+        del arr[position]
+        return arr
+    
     size = len(arr)
     
     # Left shift
@@ -137,6 +283,55 @@ delete_at_position(test_arr, 2)
 print("After deleting index 2:", test_arr)
 # Output: [10, 20, 40]
 
+# ============================================================================
+# BLOCKED LIST WITH THE GENERIC FUNCTIONS
+# ============================================================================
+
+# Test
+print("\n--- BlockList (same functions, blocked storage) ---")
+blocked = BlockList([10, 20, 30, 40, 50, 60, 70, 80], block_size=3)
+print("Blocks:", blocked.blocks)
+insert_at_position(blocked, 45, 4)
+print("After inserting 45 at index 4:", list(blocked))
+# Output: [10, 20, 30, 40, 45, 50, 60, 70, 80]
+delete_at_position(blocked, 1)
+print("After deleting index 1:", list(blocked))
+# Output: [10, 30, 40, 45, 50, 60, 70, 80]
+print("blocked[3] =", blocked[3])  # 45
+print("blocked[2:5] =", blocked[2:5])  # BlockList([40, 45, 50])
+print("blocked == 'text':", blocked == "text")  # False (not a TypeError)
+
+
+def benchmark_block_list(n=1_000_000, ops=2_000, seed=13):
+    """Random middle inserts + deletes: list.insert / del vs BlockList"""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    positions = [rng.randint(0, n // 2) + n // 4 for _ in range(ops)]
+
+    plain = list(range(n))
+    start = time.time()
+    for i, pos in enumerate(positions):
+        plain.insert(pos, -i)
+        del plain[pos // 2]
+    list_time = time.time() - start
+
+    blocked = BlockList(range(n))
+    start = time.time()
+    for i, pos in enumerate(positions):
+        insert_at_position(blocked, -i, pos)
+        delete_at_position(blocked, pos // 2)
+    block_time = time.time() - start
+
+    assert blocked == plain
+    print(f"n = {n:,}, {ops:,} inserts + {ops:,} deletes")
+    print(f"list.insert / del: {list_time:.4f}s")
+    print(f"BlockList:         {block_time:.4f}s ({list_time / block_time:.1f}x faster)")
+
+if __name__ == "__main__":
+    benchmark_block_list()
+
 # ============================================================================
 # MOVING ZEROS TO END - Two Methods
 # ============================================================================
@@ -201,6 +396,192 @@ print("\nOriginal:", arr3)
 move_zeros_swap(arr3)
 print("Method 3 (swap):", arr3)
 
+# ============================================================================
+# STABLE PARTITION ON TYPED BUFFERS (array.array, bytearray, NumPy)
+# ============================================================================
+"""
+Move zeros is a special case of STABLE PARTITION:
+    items that pass the test go first (order kept), the rest go after
+
+Typed buffers (array.array, bytearray, np.ndarray) store raw numbers, so
+NumPy can work on them directly (no copy, in place) with a boolean mask:
+    mask = buf != 0                      [F, T, F, T, T, F]
+    kept = buf[mask]   rest = buf[~mask]
+    buf[:k] = kept     buf[k:] = rest
+
+Files bigger than RAM (np.memmap): go chunk by chunk. The write position
+never passes the read position, so kept items are written straight back;
+the rest is spilled to a temp file (or just filled, e.g. with zeros).
+"""
+
+import tempfile
+import time
+from array import array
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+
+def stable_partition(buf, predicate=None, chunk_size=None, fill=None):
+    """
+    In-place stable partition of a list, array.array, bytearray or np.ndarray
+
+    Args:
+        buf: mutable sequence or buffer (np.memmap works too)
+        predicate: test applied to a whole NumPy chunk (vectorized, e.g.
+            lambda x: x > 0) or to single items on the Python path.
+            Default: non-zero (move zeros to the end)
+        chunk_size: process in chunks of this many items (O(chunk) memory)
+        fill: write this value after the kept items instead of keeping the
+            rest (with the default predicate, fill defaults to 0)
+
+    Returns:
+        int: number of items that passed (the split point)
+
+    Time: O(n), Space: O(n) for a full mask, O(chunk_size) chunked
+    """
+    if predicate is None:
+        predicate = lambda x: x != 0
+        if fill is None:
+            fill = 0
+
+    if np is None or isinstance(buf, list):
+        return stable_partition_py(buf, predicate, fill)
+
+    view = buf if isinstance(buf, np.ndarray) else np.asarray(memoryview(buf))
+    if chunk_size is None:
+        mask = np.asarray(predicate(view), dtype=bool)
+        kept = view[mask]
+        count = len(kept)
+        if fill is None:
+            view[count:] = view[~mask]
+        else:
+            view[count:] = fill
+        view[:count] = kept
+    else:
+        count = stable_partition_chunked(view, predicate, chunk_size, fill)
+
+    if hasattr(view, "flush"):
+        view.flush()
+    return count
+
+
+def stable_partition_chunked(view, predicate, chunk_size, fill):
+    """Chunked pass for arrays bigger than memory (see stable_partition)"""
+    n = len(view)
+    write = 0
+    spill = tempfile.TemporaryFile() if fill is None else None
+    try:
+        for start in range(0, n, chunk_size):
+            chunk = np.array(view[start:start + chunk_size])  # copy: we overwrite
+            mask = np.asarray(predicate(chunk), dtype=bool)
+            kept = chunk[mask]
+            view[write:write + len(kept)] = kept
+            write += len(kept)
+            if spill is not None:
+                chunk[~mask].tofile(spill)
+
+        if spill is None:
+            for start in range(write, n, chunk_size):
+                view[start:start + chunk_size] = fill
+        else:
+            spill.seek(0)
+            position = write
+            while position < n:
+                rest = np.fromfile(spill, dtype=view.dtype, count=chunk_size)
+                view[position:position + len(rest)] = rest
+                position += len(rest)
+    finally:
+        if spill is not None:
+            spill.close()
+    return write
+
+
+def stable_partition_py(buf, predicate, fill=None):
+    """Element-by-element fallback (lists, or no NumPy)"""
+    kept = [x for x in buf if predicate(x)]
+    if fill is None:
+        rest = [x for x in buf if not predicate(x)]
+    else:
+        rest = [fill] * (len(buf) - len(kept))
+    for i, x in enumerate(kept + rest):
+        buf[i] = x
+    return len(kept)
+
+# Test
+print("\n--- Stable Partition (typed buffers) ---")
+telemetry = array("i", [0, 10, 0, 20, 30, 0, 40, 0])
+count = stable_partition(telemetry)
+print(f"array('i'): {telemetry.tolist()}, non-zero: {count}")
+# [10, 20, 30, 40, 0, 0, 0, 0], non-zero: 4
+
+raw = bytearray(b"\x00\x05\x00\x07\x09")
+stable_partition(raw)
+print(f"bytearray: {list(raw)}")           # [5, 7, 9, 0, 0]
+
+readings = array("d", [3.5, -1.0, 2.0, -4.5, 0.5])
+count = stable_partition(readings, lambda x: x > 0)
+print(f"positives first: {readings.tolist()}, count: {count}")
+# [3.5, 2.0, 0.5, -1.0, -4.5], count: 3 (negatives keep their order)
+
+items = [0, 1, 0, 3, 12]
+stable_partition(items)
+print(f"list: {items}")                    # [1, 3, 12, 0, 0] (same as move_zeros_swap)
+
+slots = array("i", [0, 4, 0, 6])
+stable_partition(slots, fill=-1)
+print(f"fill=-1: {slots.tolist()}")        # [4, 6, -1, -1]
+
+
+def benchmark_stable_partition(n=1_000_000, density=0.1, chunk_size=1 << 16, seed=19):
+    """
+    Sparse buffer (10% non-zero): move_zeros_swap on a list vs
+    stable_partition on array('q') in memory and on a chunked np.memmap
+    """
+    import os
+    import random
+    rng = random.Random(seed)
+    values = [rng.randint(1, 1000) if rng.random() < density else 0 for _ in range(n)]
+    expected = move_zeros_method1(values)
+
+    data = list(values)
+    start = time.time()
+    move_zeros_swap(data)
+    swap_time = time.time() - start
+    assert data == expected
+    print(f"n = {n:,}, {density:.0%} non-zero")
+    print(f"move_zeros_swap (list):     {swap_time:.4f}s")
+
+    if np is None:
+        print("Install NumPy for the vectorized paths")
+        return
+
+    buf = array("q", values)
+    start = time.time()
+    stable_partition(buf)
+    mask_time = time.time() - start
+    assert buf.tolist() == expected
+    print(f"stable_partition (array):   {mask_time:.4f}s ({swap_time / mask_time:.0f}x faster)")
+
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    try:
+        disk = np.memmap(path, dtype=np.int64, mode="w+", shape=(n,))
+        disk[:] = values
+        start = time.time()
+        stable_partition(disk, chunk_size=chunk_size)
+        chunk_time = time.time() - start
+        assert disk.tolist() == expected
+        del disk
+        print(f"stable_partition (memmap):  {chunk_time:.4f}s (chunks of {chunk_size:,})")
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    benchmark_stable_partition()
+
 # ============================================================================
 # KEY TAKEAWAYS
 # ============================================================================
@@ -215,8 +596,15 @@ DELETION:
 ✓ Remove last element
 ✓ Time: O(n) due to shifting
 
+BLOCKED LIST:
+✓ Many middle inserts/deletes? Only one small block shifts
+✓ Fenwick tree over block lengths finds the block in O(log B)
+✓ Same insert_at_position / delete_at_position calls work on it
+
 MOVING ZEROS:
 ✓ Two-pointer technique is optimal
 ✓ In-place saves memory
 ✓ Swap method is cleanest
+✓ Typed buffers (array.array, bytearray, NumPy): stable_partition with a
+  boolean mask, chunked for memory-mapped files
 """
\ No newline at end of file
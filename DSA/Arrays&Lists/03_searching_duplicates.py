@@ -81,6 +81,147 @@ print("\n--- Try Your Own Number ---")
 # else:
 #     print(f"{user_input} is NOT an Armstrong number")
 
+# ----------------------------------------------------------------------------
+# Scanning a whole range: armstrong_range(lo, hi)
+# ----------------------------------------------------------------------------
+"""
+Checking 10^9 numbers one by one with str() and d ** power is slow
+Speed-ups:
+    1. Group by digit count → the power is fixed for the whole group
+    2. Lookup table: sum of d-th powers for every 4-digit chunk 0000..9999
+       (1234 → 1^4 + 2^4 + 3^4 + 4^4), so one lookup handles 4 digits
+    3. NumPy: do it for a block of a million numbers at once
+           sums += table[nums % 10000];  nums //= 10000
+    4. Optional process pool: blocks are independent
+"""
+
+import time
+from functools import lru_cache
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+TABLE_WIDTH = 4  # digits per table lookup → table has 10^4 entries
+
+
+@lru_cache(maxsize=None)
+def digit_power_table(power):
+    """table[t] = sum of digit ** power over the 4 digits of t (0-padded)"""
+    single = [d ** power for d in range(10)]
+    table = [0] * 10 ** TABLE_WIDTH
+    for t in range(1, 10 ** TABLE_WIDTH):
+        table[t] = table[t // 10] + single[t % 10]
+    return table
+
+
+def armstrong_block(task):
+    """Armstrong numbers in [start, stop), all with `power` digits"""
+    start, stop, power = task
+    table = digit_power_table(power)
+    chunk = 10 ** TABLE_WIDTH
+
+    # int64 is safe while power * 9^power stays below 2^63 (power <= 18)
+    if np is not None and power <= 18:
+        nums = np.arange(start, stop, dtype=np.int64)
+        rest = nums.copy()
+        sums = np.zeros_like(nums)
+        lookup = np.array(table, dtype=np.int64)
+        for _ in range(-(-power // TABLE_WIDTH)):
+            sums += lookup[rest % chunk]
+            rest //= chunk
+        return [int(x) for x in nums[sums == nums]]
+
+    found = []
+    for num in range(start, stop):
+        total, rest = 0, num
+        while rest:
+            total += table[rest % chunk]
+            rest //= chunk
+        if total == num:
+            found.append(num)
+    return found
+
+
+def armstrong_tasks(lo, hi, block_size):
+    """Split [lo, hi) into blocks that never cross a digit-count boundary"""
+    power = len(str(lo)) if lo > 0 else 1
+    while lo < hi:
+        group_end = min(hi, 10 ** power)
+        for start in range(lo, group_end, block_size):
+            yield start, min(start + block_size, group_end), power
+        lo = group_end
+        power += 1
+
+
+def armstrong_range(lo, hi, block_size=1 << 20, workers=None):
+    """
+    Yield every Armstrong number in [lo, hi), in increasing order
+
+    Args:
+        lo, hi: range like range(lo, hi) (lo >= 0)
+        block_size: numbers checked per vectorized block
+        workers: process-pool size (None = run in this process);
+            call from under `if __name__ == "__main__":`
+
+    Same results as filtering with armstrong_number
+    """
+    if lo < 0:
+        raise ValueError("lo must be >= 0")
+    tasks = armstrong_tasks(lo, hi, block_size)
+
+    if workers is None:
+        for task in tasks:
+            yield from armstrong_block(task)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for found in pool.map(armstrong_block, tasks):
+            yield from found
+
+# Test
+print("\n--- Armstrong Range Scanner ---")
+print(f"Armstrong numbers below 10^5: {list(armstrong_range(0, 10 ** 5))}")
+# [0, 1, 2, ..., 9, 153, 370, 371, 407, 1634, 8208, 9474, 54748, 92727, 93084]
+assert list(armstrong_range(0, 10 ** 5)) == [n for n in range(10 ** 5) if armstrong_number(n)]
+print(f"Between 100 and 1000: {list(armstrong_range(100, 1000))}")  # [153, 370, 371, 407]
+
+
+def benchmark_armstrong(hi=10 ** 6, workers=None):
+    """
+    Scalar armstrong_number loop vs armstrong_range on [0, hi)
+    Full size: benchmark_armstrong(hi=10 ** 9, workers=os.cpu_count())
+    """
+    start = time.time()
+    fast = list(armstrong_range(0, hi, workers=workers))
+    fast_time = time.time() - start
+
+    scalar_hi = min(hi, 10 ** 5)  # the scalar loop is too slow beyond this
+    start = time.time()
+    slow = [n for n in range(scalar_hi) if armstrong_number(n)]
+    scalar_time = time.time() - start
+
+    assert [n for n in fast if n < scalar_hi] == slow
+    per_number = scalar_time / scalar_hi
+    print(f"Range [0, {hi:,}): {len(fast)} Armstrong numbers")
+    print(f"armstrong_number loop: {scalar_time:.4f}s for {scalar_hi:,} numbers")
+    print(f"armstrong_range:       {fast_time:.4f}s "
+          f"({per_number * hi / fast_time:.0f}x faster than the loop would be)")
+
+# armstrong_range's pool workers import this file: keep the benchmark and
+# the 10^7 pool demo out of them
+if __name__ == "__main__":
+    benchmark_armstrong()
+
+    print("\n--- Armstrong Range with a process pool ---")
+    import os
+    parallel = list(armstrong_range(0, 10 ** 7, workers=os.cpu_count()))
+    assert parallel == list(armstrong_range(0, 10 ** 7))
+    print(f"Below 10^7 (pool of {os.cpu_count()}): {parallel[-4:]}")
+    # [1741725, 4210818, 9800817, 9926315]
+
 # ============================================================================
 # FINDING MIN & MAX
 # ============================================================================
@@ -119,6 +260,257 @@ min_val, max_val = find_min_max(test_arr)
 print(f"Array: {test_arr}")
 print(f"Minimum: {min_val}, Maximum: {max_val}")
 
+# ----------------------------------------------------------------------------
+# Faster min & max: pairwise, chunked (memmap), parallel shards
+# ----------------------------------------------------------------------------
+"""
+1. Pairwise (lists): compare the two items of a pair with EACH OTHER first
+       smaller vs min, larger vs max → 3 comparisons per 2 items (not 4)
+   Fewer comparisons only pays off when comparing is EXPENSIVE (Fraction,
+   objects with __lt__). For ints/floats/strings CPython compares in C and
+   the loop overhead dominates → the plain scan is faster (see benchmark)
+
+2. Chunked (np.memmap, data on disk): np.min / np.max per chunk of a few
+   million items; only one chunk is in RAM at a time
+
+3. Parallel shards (tens of GB): each process scans its own slice of the
+   file and returns (min, max, argmin, argmax); merging is trivial:
+       smaller min wins, ties → smaller index (first occurrence)
+"""
+
+def find_min_max_pairwise(arr):
+    """
+    Min and max with ~1.5 comparisons per element
+
+    Returns:
+        tuple: (min_value, max_value), same as find_min_max
+    """
+    n = len(arr)
+    if n == 0:
+        return None, None
+
+    # Odd length: first item starts both; even: first pair does
+    if n % 2:
+        min_num = max_num = arr[0]
+        start = 1
+    else:
+        min_num, max_num = (arr[0], arr[1]) if arr[0] < arr[1] else (arr[1], arr[0])
+        start = 2
+
+    for i in range(start, n, 2):
+        a, b = arr[i], arr[i + 1]
+        if a < b:
+            if a < min_num:
+                min_num = a
+            if b > max_num:
+                max_num = b
+        else:
+            if b < min_num:
+                min_num = b
+            if a > max_num:
+                max_num = a
+
+    return min_num, max_num
+
+
+def min_max_summary(data, start=0, stop=None, chunk_size=1 << 22):
+    """
+    (min, max, argmin, argmax) of data[start:stop], chunk by chunk
+
+    Works on np.ndarray / np.memmap without loading everything.
+    Lists (or no NumPy) use min / max over each chunk instead.
+    Indices are positions in `data`; ties keep the first occurrence.
+    """
+    stop = len(data) if stop is None else stop
+    vectorized = np is not None and isinstance(data, np.ndarray)
+    best = None
+    for lo in range(start, stop, chunk_size):
+        chunk = data[lo:min(lo + chunk_size, stop)]
+        if vectorized:
+            i_min = int(np.argmin(chunk))
+            i_max = int(np.argmax(chunk))
+            low, high = chunk[i_min].item(), chunk[i_max].item()
+        else:
+            # min / max return the first index among equal values
+            i_min = min(range(len(chunk)), key=chunk.__getitem__)
+            i_max = max(range(len(chunk)), key=chunk.__getitem__)
+            low, high = chunk[i_min], chunk[i_max]
+        best = merge_min_max(best, (low, high, lo + i_min, lo + i_max))
+    return best
+
+
+def merge_min_max(left, right):
+    """Combine two (min, max, argmin, argmax) summaries (None = empty)"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    lo_min, lo_arg = min((left[0], left[2]), (right[0], right[2]))
+    hi_max, hi_arg = max((left[1], -left[3]), (right[1], -right[3]))
+    return lo_min, hi_max, lo_arg, -hi_arg
+
+
+def file_offset(data):
+    """Byte offset of data[0] in its file (a slice keeps its parent's .offset)"""
+    root = data
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    return root.offset + (data.ctypes.data - root.ctypes.data)
+
+
+def min_max_shard(task):
+    """Worker: open the file read-only and summarise one shard"""
+    path, dtype, offset, length, start, stop = task
+    data = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(length,))
+    try:
+        return min_max_summary(data, start, stop)
+    finally:
+        del data
+
+
+def find_min_max_parallel(data, workers=None, shards=None):
+    """
+    (min, max, argmin, argmax) of a file-backed np.memmap with a process pool
+
+    Only (path, dtype, offset, slice) goes to each worker, never the data.
+    Anything else (list, in-memory array, strided view) is summarised in
+    this process with min_max_summary.
+    Call from under `if __name__ == "__main__":`
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    n = len(data)
+    if n == 0:
+        return None
+    if (np is None or not isinstance(data, np.memmap) or not data.filename
+            or not data.flags.c_contiguous):
+        return min_max_summary(data)
+    path, offset = data.filename, file_offset(data)
+    workers = workers or os.cpu_count() or 1
+    shards = shards or workers
+    step = -(-n // shards)
+    tasks = [(path, data.dtype.str, offset, n, lo, min(lo + step, n))
+             for lo in range(0, n, step)]
+
+    result = None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for summary in pool.map(min_max_shard, tasks):
+            result = merge_min_max(result, summary)
+    return result
+
+
+CHEAP_COMPARE = (int, float, str, bytes, tuple)
+
+
+def find_min_max_fast(data, workers=None):
+    """
+    Pick the fastest path for the input
+
+    list of ints / floats / str → find_min_max (cheap compares)
+    list of other objects       → find_min_max_pairwise (fewer compares)
+    np.ndarray / memmap         → chunked np.min / max
+    memmap + workers            → parallel shards
+    Always returns (min, max)
+    """
+    if np is None or not isinstance(data, np.ndarray):
+        if len(data) and isinstance(data[0], CHEAP_COMPARE):
+            return find_min_max(data)
+        return find_min_max_pairwise(data)
+    if workers and isinstance(data, np.memmap) and data.filename:
+        summary = find_min_max_parallel(data, workers)
+    else:
+        summary = min_max_summary(data)
+    return (None, None) if summary is None else summary[:2]
+
+# Test
+print("\n--- Faster Min & Max ---")
+print(f"Pairwise: {find_min_max_pairwise(test_arr)}")           # (1, 9)
+print(f"Pairwise (even length): {find_min_max_pairwise([4, 2, 7, 7, -3, 5])}")  # (-3, 7)
+readings = [3, 5, 1, 9, 2, 8, 1, 9]
+if np is not None:
+    readings = np.array(readings)
+print(f"Summary (min, max, argmin, argmax): {min_max_summary(readings, chunk_size=3)}")
+# (1, 9, 2, 3) - first occurrences
+
+
+def benchmark_find_min_max(n=2_000_000, chunk_size=1 << 20, seed=29):
+    """
+    Two comparisons vs pairwise on a list, then chunked scan of a memmap
+    Tens-of-GB files: find_min_max_parallel(np.memmap(path, ...), workers=8)
+    """
+    import os
+    import random
+    import tempfile
+    rng = random.Random(seed)
+    values = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(n)]
+
+    start = time.time()
+    expected = find_min_max(values)
+    scan_time = time.time() - start
+
+    start = time.time()
+    assert find_min_max_pairwise(values) == expected
+    pair_time = time.time() - start
+    print(f"n = {n:,} ints")
+    print(f"find_min_max (2 compares):   {scan_time:.4f}s")
+    print(f"pairwise (1.5 compares):     {pair_time:.4f}s  (ints compare in C)")
+
+    # Expensive comparisons: every Fraction < Fraction runs Python code
+    from fractions import Fraction
+    ratios = [Fraction(v, 1 + i % 997) for i, v in enumerate(values[:n // 10])]
+    start = time.time()
+    expected_ratio = find_min_max(ratios)
+    scan_time = time.time() - start
+    start = time.time()
+    assert find_min_max_pairwise(ratios) == expected_ratio
+    pair_time = time.time() - start
+    print(f"{len(ratios):,} Fractions: scan {scan_time:.4f}s, "
+          f"pairwise {pair_time:.4f}s ({scan_time / pair_time:.1f}x)")
+
+    if np is None:
+        return
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    try:
+        np.array(values, dtype=np.int64).tofile(path)
+        disk = np.memmap(path, dtype=np.int64, mode="r")
+        start = time.time()
+        summary = min_max_summary(disk, chunk_size=chunk_size)
+        chunk_time = time.time() - start
+        assert summary[:2] == expected
+        assert summary[2] == values.index(expected[0])
+        assert summary[3] == values.index(expected[1])
+        del disk
+        print(f"memmap chunks of {chunk_size:,}: {chunk_time:.4f}s")
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    benchmark_find_min_max()
+
+if __name__ == "__main__" and np is not None:
+    print("\n--- Parallel min & max over a memmap ---")
+    import os
+    import tempfile
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    try:
+        sensor = np.arange(1_000_000, dtype=np.float64) % 977
+        sensor[123_456] = -5.0
+        sensor.tofile(path)
+        disk = np.memmap(path, dtype=np.float64, mode="r")
+        print(find_min_max_parallel(disk, workers=4))  # (-5.0, 976.0, 123456, 976)
+
+        # A slice is read from its own start, not the parent's
+        tail = disk[500_000:]
+        summary = find_min_max_parallel(tail, workers=4)
+        assert summary == min_max_summary(np.array(tail))
+        print(summary)  # (0.0, 976.0, 224, 223)
+        del disk, tail
+    finally:
+        os.remove(path)
+
 # ============================================================================
 # REVERSE ARRAY IN-PLACE
 # ============================================================================
@@ -242,9 +634,16 @@ FINDING DUPLICATES:
 ✓ Use dictionary for frequency counting
 ✓ Time: O(n), Space: O(n)
 
+ARMSTRONG RANGE:
+✓ Group by digit count, look up 4 digits at a time in a power table
+✓ NumPy blocks + optional process pool for ranges up to 10^9
+
 FINDING MIN/MAX:
 ✓ Single pass comparison
 ✓ Initialize with first element
+✓ Pairwise: 3 compares per 2 items (wins when compares are expensive)
+✓ Huge files: chunked np.memmap scan, or parallel shards merged by
+  (min, max, argmin, argmax)
 
 REVERSE ARRAY:
 ✓ Two pointers from both ends
@@ -4,6 +4,159 @@ Arrays & Lists - Finding Kth Largest Element
 Learn to find 2nd largest, 3rd largest, or any Kth largest element
 """
 
+import math
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # lists only; numeric arrays fall back to introselect
+
+# ============================================================================
+# SELECTION ENGINE: Introselect + numpy.partition
+# ============================================================================
+"""
+Selection = find the element that WOULD be at position i after sorting,
+without sorting everything
+
+Quickselect: partition around a pivot, recurse into ONE side only
+→ O(n) average, but O(n²) with unlucky pivots
+Introselect: quickselect with median-of-3 pivots, and if recursion gets
+too deep (> 2·log2(n)) switch to median-of-medians → O(n) worst case
+
+Three paths:
+1. Python lists → in-place introselect
+2. NumPy arrays → numpy.partition (C speed)
+3. Many k at once → ONE partitioning pass shared by all positions
+"""
+
+def partition_three_way(arr, left, right, pivot):
+    """
+    Dutch-flag partition of arr[left..right] around pivot (in-place)
+
+    Returns (lt, gt):
+        arr[left..lt-1] < pivot, arr[lt..gt] == pivot, arr[gt+1..right] > pivot
+    Duplicates land in the middle block → no O(n²) on repeated values
+    """
+    lt, i, gt = left, left, right
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif arr[i] > pivot:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def median_of_medians(arr, left, right):
+    """Guaranteed-good pivot: median of the medians of groups of 5"""
+    medians = []
+    for start in range(left, right + 1, 5):
+        group = sorted(arr[start:min(start + 5, right + 1)])
+        medians.append(group[len(group) // 2])
+    if len(medians) <= 5:
+        return sorted(medians)[len(medians) // 2]
+    return select_smallest(medians, len(medians) // 2)
+
+
+def select_many_inplace(arr, positions, left, right, depth):
+    """Place every sorted position in `positions` (ascending) correctly"""
+    while positions and left < right:
+        if depth > 0:
+            # Median-of-3 pivot (fast, usually good)
+            mid = (left + right) // 2
+            pivot = sorted((arr[left], arr[mid], arr[right]))[1]
+            depth -= 1
+        else:
+            # Too deep → bad pivots → switch to worst-case O(n) pivot
+            pivot = median_of_medians(arr, left, right)
+
+        lt, gt = partition_three_way(arr, left, right, pivot)
+
+        # Positions inside the == block are done
+        lower = [p for p in positions if p < lt]
+        upper = [p for p in positions if p > gt]
+
+        # Recurse into the smaller group of positions, loop on the other
+        if len(lower) <= len(upper):
+            select_many_inplace(arr, lower, left, lt - 1, depth)
+            positions, left = upper, gt + 1
+        else:
+            select_many_inplace(arr, upper, gt + 1, right, depth)
+            positions, right = lower, lt - 1
+
+
+def select_smallest(arr, index):
+    """
+    In-place introselect: value at sorted position `index` (0-based)
+
+    Time: O(n) worst case, Space: O(log n) recursion
+    """
+    if not 0 <= index < len(arr):
+        raise IndexError("selection index out of range")
+    depth = 2 * max(1, int(math.log2(len(arr) or 1)))
+    select_many_inplace(arr, [index], 0, len(arr) - 1, depth)
+    return arr[index]
+
+
+def kth_largest_select(arr, k, inplace=False):
+    """
+    Kth largest (1-indexed, duplicates count) via the selection engine
+
+    NumPy array → numpy.partition, list → introselect
+    (on a copy unless inplace=True)
+    Time: O(n), Space: O(n) for the copy, O(1) extra with inplace=True
+    """
+    if k > len(arr) or k < 1:
+        return None
+    index = len(arr) - k  # kth largest = (n-k)th smallest
+
+    if np is not None and isinstance(arr, np.ndarray):
+        return np.partition(arr, index)[index].item()
+
+    work = arr if inplace else list(arr)
+    return select_smallest(work, index)
+
+
+def kth_largest_many(arr, ks, inplace=False):
+    """
+    Several order statistics from ONE partitioning pass
+
+    ks: list of k values (1-indexed largest) → list of answers
+    Invalid k → None in that slot
+    """
+    n = len(arr)
+    valid = sorted({n - k for k in ks if 1 <= k <= n})
+
+    if np is not None and isinstance(arr, np.ndarray):
+        if valid:
+            parted = np.partition(arr, valid)
+            found = {i: parted[i].item() for i in valid}
+        else:
+            found = {}
+    else:
+        work = arr if inplace else list(arr)
+        if valid:
+            depth = 2 * max(1, int(math.log2(n)))
+            select_many_inplace(work, valid, 0, n - 1, depth)
+        found = {i: work[i] for i in valid}
+
+    return [found.get(n - k) if 1 <= k <= n else None for k in ks]
+
+# Test
+print("--- Selection Engine ---")
+test_arr = [3, 7, 2, 9, 1, 5, 8]
+print(f"Array: {test_arr}")
+print(f"3rd largest (introselect): {kth_largest_select(test_arr, 3)}")  # 7
+print(f"1st/2nd/7th largest (one pass): {kth_largest_many(test_arr, [1, 2, 7])}")
+# [9, 8, 1]
+if np is not None:
+    print(f"3rd largest (numpy.partition): {kth_largest_select(np.array(test_arr), 3)}")
+print()
+
 # ============================================================================
 # PROBLEM: FIND SECOND LARGEST
 # ============================================================================
@@ -11,6 +164,7 @@ Learn to find 2nd largest, 3rd largest, or any Kth largest element
 Challenge: Find the second largest number in ONE pass
 Cannot sort (would be O(n log n))
 Must do in O(n) time
+(For any k, use kth_largest_select / kth_largest_many above)
 """
 
 def find_second_largest(arr):
@@ -30,31 +184,31 @@ def find_second_largest(arr):
         For each number:
             - If bigger than largest → cascade values
             - Else if bigger than second_largest → update it
+        Start from arr[0] only (second_largest = None, "not found
+        yet"), so a repeated first value is skipped like every
+        other repeat ([5, 5, 4] → 4)
     """
     # Edge case
     if len(arr) < 2:
         return None
     
-    # Initialize with first two numbers
-    if arr[0] > arr[1]:
-        largest = arr[0]
-        second_largest = arr[1]
-    else:
-        largest = arr[1]
-        second_largest = arr[0]
+    # Initialize with the first number only
+    largest = arr[0]
+    second_largest = None
     
     # Process remaining elements
-    for i in range(2, len(arr)):
+    for i in range(1, len(arr)):
         num = arr[i]
         
         if num > largest:
             # New largest found! Old largest becomes second
             second_largest = largest
             largest = num
-        elif num > second_largest and num != largest:
+        elif num != largest and (second_largest is None or num > second_largest):
             # Not largest, but bigger than current second
             second_largest = num
     
+    # Still None → all values equal
     return second_largest
 
 # Test
@@ -100,14 +254,13 @@ def find_third_largest(arr):
     if len(arr) < 3:
         return None
     
-    # Initialize with first three numbers (sorted)
-    first_three = sorted([arr[0], arr[1], arr[2]], reverse=True)
-    largest = first_three[0]
-    second_largest = first_three[1]
-    third_largest = first_three[2]
+    # Initialize with the first number only (same as second largest)
+    largest = arr[0]
+    second_largest = None
+    third_largest = None
     
     # Process remaining elements
-    for i in range(3, len(arr)):
+    for i in range(1, len(arr)):
         num = arr[i]
         
         if num > largest:
@@ -116,15 +269,17 @@ def find_third_largest(arr):
             second_largest = largest
             largest = num
             
-        elif num > second_largest and num != largest:
+        elif num != largest and (second_largest is None or num > second_largest):
             # Cascade: second → third
             third_largest = second_largest
             second_largest = num
             
-        elif num > third_largest and num != second_largest and num != largest:
+        elif (num != largest and num != second_largest
+              and (third_largest is None or num > third_largest)):
             # Just update third
             third_largest = num
     
+    # Still None → fewer than three distinct values
     return third_largest
 
 # Test
@@ -133,7 +288,7 @@ test_arr = [3, 7, 2, 9, 1, 5, 8]
 result = find_third_largest(test_arr)
 print(f"Array: {test_arr}")
 print(f"Third largest: {result}")
-print(f"Expected: 5 (9, 8, 5 are top 3)")
+print("Expected: 7 (9, 8, 7 are top 3)")
 
 # ============================================================================
 # GENERIC SOLUTION: Kth LARGEST
@@ -256,6 +411,196 @@ for k in range(1, 6):
     result = kth_largest_heap(test_arr, k)
     print(f"{k}th largest: {result}")
 
+# ============================================================================
+# MERGEABLE TOP-K TRACKER (sharded streams)
+# ============================================================================
+"""
+kth_largest_heap needs the whole list in memory, in one process
+TopK = the same bounded min-heap, but as an object:
+- push / extend: feed it a stream, memory stays O(k)
+- merge: combine two trackers (e.g. one per file shard) in O(k log k)
+- picklable: plain list + int, so a process pool can return it
+
+Shard 1 ─► TopK ─┐
+Shard 2 ─► TopK ─┼─► merge ─► global top-k
+Shard 3 ─► TopK ─┘
+"""
+
+import random
+from functools import reduce
+
+class TopK:
+    """
+    Bounded min-heap keeping the k largest values seen so far
+
+    heap[0] is the kth largest once k values have been seen
+    """
+    def __init__(self, k):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.heap = []
+
+    def push(self, value):
+        """O(log k)"""
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, value)
+        elif value > self.heap[0]:
+            heapq.heapreplace(self.heap, value)
+
+    def extend(self, values):
+        """Consume any iterable (file, generator, list...)"""
+        for value in values:
+            self.push(value)
+        return self
+
+    def merge(self, other):
+        """Absorb another tracker in O(k log k); returns self"""
+        if other.k != self.k:
+            raise ValueError("cannot merge trackers with different k")
+        for value in other.heap:
+            self.push(value)
+        return self
+
+    def kth_largest(self):
+        """Same answer as kth_largest_heap (None until k values seen)"""
+        return self.heap[0] if len(self.heap) == self.k else None
+
+    def top(self):
+        """The k largest values, largest first"""
+        return sorted(self.heap, reverse=True)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __repr__(self):
+        return f"TopK(k={self.k}, top={self.top()})"
+
+
+def topk_from_file(task):
+    """Pool worker: one number per line → TopK (never loads the file)"""
+    path, k = task
+    with open(path) as shard:
+        return TopK(k).extend(int(line) for line in shard if line.strip())
+
+
+def topk_sharded(paths, k, workers=None):
+    """Global top-k over many file shards with a process pool"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        trackers = pool.map(topk_from_file, [(path, k) for path in paths])
+        return reduce(TopK.merge, trackers, TopK(k))
+
+# Test: TopK must match sorted(...)[-k]
+print("\n--- Mergeable TopK ---")
+import pickle
+
+rng = random.Random(31)
+for trial in range(200):
+    data = [rng.randint(-50, 50) for _ in range(rng.randint(1, 60))]
+    k = rng.randint(1, len(data))
+
+    # One tracker fed as a stream
+    assert TopK(k).extend(iter(data)).kth_largest() == sorted(data)[-k]
+
+    # Split into shards, pickle round-trip (like a process pool), merge
+    cut = rng.randint(0, len(data))
+    left = pickle.loads(pickle.dumps(TopK(k).extend(data[:cut])))
+    right = pickle.loads(pickle.dumps(TopK(k).extend(data[cut:])))
+    merged = left.merge(right)
+    assert merged.kth_largest() == sorted(data)[-k]
+    assert merged.top() == sorted(data, reverse=True)[:k]
+    assert merged.kth_largest() == kth_largest_heap(data, k)
+print("TopK matches sorted(...)[-k] on 200 random shard splits ✓")
+
+tracker = TopK(3).extend([3, 7, 2, 9, 1])
+tracker.merge(TopK(3).extend([5, 8]))
+print(tracker)                # TopK(k=3, top=[9, 8, 7])
+print(tracker.kth_largest())  # 7
+
+# Sharded TopK demo: each shard is read in a ProcessPoolExecutor, whose
+# workers import this file - so the demo is script-only
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        paths, everything = [], []
+        for shard in range(4):
+            values = [rng.randint(0, 10**6) for _ in range(25_000)]
+            everything.extend(values)
+            path = os.path.join(folder, f"shard_{shard}.txt")
+            with open(path, "w") as out:
+                out.write("\n".join(map(str, values)))
+            paths.append(path)
+
+        result = topk_sharded(paths, 100)
+        assert result.kth_largest() == sorted(everything)[-100]
+        print(f"Sharded top-100 over {len(paths)} files: "
+              f"100th largest = {result.kth_largest()} ✓")
+
+# ============================================================================
+# BENCHMARK: bubble vs heap vs introselect vs numpy.partition
+# ============================================================================
+
+import time
+
+def benchmark_selection(n=20_000, ks=None, seed=29):
+    """
+    Time every Kth-largest approach for k = 1 .. n/2
+
+    kth_largest (O(n·k)) is skipped once k > 1000 - it would take minutes
+    """
+    rng = random.Random(seed)
+    data = [rng.randint(-10**6, 10**6) for _ in range(n)]
+    ks = ks or [1, 10, 100, 1000, n // 4, n // 2]
+    np_data = np.array(data) if np is not None else None
+
+    print(f"n = {n}")
+    print(f"{'k':>7} {'bubble':>9} {'heap':>9} {'select':>9} {'np.part':>9}")
+    for k in ks:
+        expected = sorted(data, reverse=True)[k - 1]
+        row = []
+
+        if k <= 1000:
+            start = time.time()
+            assert kth_largest(data, k) == expected
+            row.append(f"{time.time() - start:9.4f}")
+        else:
+            row.append(f"{'skipped':>9}")
+
+        start = time.time()
+        assert kth_largest_heap(data, k) == expected
+        row.append(f"{time.time() - start:9.4f}")
+
+        start = time.time()
+        assert kth_largest_select(data, k) == expected
+        row.append(f"{time.time() - start:9.4f}")
+
+        if np_data is not None:
+            start = time.time()
+            assert kth_largest_select(np_data, k) == expected
+            row.append(f"{time.time() - start:9.4f}")
+
+        print(f"{k:>7} " + " ".join(row))
+
+    # Multi-k: one pass for all positions vs one select per k
+    start = time.time()
+    separate = [kth_largest_select(data, k) for k in ks]
+    separate_time = time.time() - start
+    start = time.time()
+    together = kth_largest_many(data, ks)
+    together_time = time.time() - start
+    assert separate == together
+    print(f"\n{len(ks)} ks one by one: {separate_time:.4f}s, "
+          f"kth_largest_many: {together_time:.4f}s")
+
+# Guarded like the pool demo: spawn workers must not rerun the benchmark
+if __name__ == "__main__":
+    print("\n--- Benchmark: Kth largest approaches ---")
+    benchmark_selection()
+
 # ============================================================================
 # VISUALIZING THE DIFFERENCE
 # ============================================================================
@@ -280,6 +625,11 @@ comparison = """
    ├─ Pros: One line, very simple
    ├─ Cons: O(n log n), wasteful for large arrays
    └─ Use: Small arrays, quick prototypes
+
+4. SELECTION ENGINE (Introselect / numpy.partition)
+   ├─ Pros: O(n) for ANY k, several k in one pass
+   ├─ Cons: Reorders the data (works on a copy by default)
+   └─ Use: Large arrays, large k, percentiles
 """
 
 print(comparison)
@@ -333,9 +683,14 @@ APPROACH 4: Sort (Simple)
 ✓ Quick but inefficient
 ✓ Use for small data
 
+APPROACH 5: Selection (Introselect)
+✓ Time: O(n) worst case, Space: O(n) copy
+✓ numpy.partition for numeric arrays
+✓ Best for large K or many K at once
+
 WHEN TO USE EACH:
 - K is small (2-3): Manual tracking
 - K is medium (4-10): Our generic or heap
-- K is large or dynamic: Heap only
+- K is large or dynamic: Heap or selection engine
 - One-time operation: Just sort!
 """
\ No newline at end of file
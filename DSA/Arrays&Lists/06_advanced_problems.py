@@ -220,6 +220,208 @@ result = trap_water(elevation)
 print(f"Water trapped: {result}")
 print("Expected: 6")
 
+# ----------------------------------------------------------------------------
+# Many profiles at once: running maxima with NumPy
+# ----------------------------------------------------------------------------
+"""
+Same formula, whole rows at a time:
+    left_max  = running max from the left    (np.maximum.accumulate)
+    right_max = running max from the right   (accumulate on reversed row)
+    water     = sum(min(left_max, right_max) - height)
+
+Rows of a 2-D array are independent profiles, so one call handles all of
+them. Rows are processed in blocks to keep the temporaries small
+(10^5 profiles × 10^4 columns would be 8 GB per int64 temporary!)
+"""
+
+import time
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+
+def trap_water_batch(heights, block_rows=None):
+    """
+    Trapped water for every row (profile) of a 2-D height array
+
+    Args:
+        heights: 2-D array / list of equal-length rows (np.memmap works too)
+        block_rows: rows per block (default: ~4M cells per block)
+
+    Returns:
+        Water per profile: np.ndarray (int64 for integer heights, float64
+        for float terrain, never truncated), or a list without NumPy
+
+    Time: O(rows × cols), Space: O(block_rows × cols)
+    """
+    if np is None:
+        return [trap_water(list(row)) for row in heights]
+
+    heights = np.asarray(heights)
+    if heights.ndim != 2:
+        raise ValueError("heights must be 2-D: one profile per row")
+    rows, cols = heights.shape
+    # Promote small ints to int64 (no overflow), keep floats as floats
+    dtype = np.result_type(heights.dtype, np.int64)
+    result = np.zeros(rows, dtype=dtype)
+    if rows == 0 or cols == 0:
+        return result
+
+    if block_rows is None:
+        block_rows = max(1, (1 << 22) // cols)
+
+    for start in range(0, rows, block_rows):
+        block = np.asarray(heights[start:start + block_rows], dtype=dtype)
+        left_max = np.maximum.accumulate(block, axis=1)
+        right_max = np.maximum.accumulate(block[:, ::-1], axis=1)[:, ::-1]
+
+        # Reuse left_max as the water-level buffer
+        np.minimum(left_max, right_max, out=left_max)
+        left_max -= block
+        result[start:start + block_rows] = left_max.sum(axis=1)
+
+    return result
+
+
+def trap_water_np(height):
+    """Single profile through the vectorized path (int or float, like trap_water)"""
+    water = trap_water_batch([height])[0]
+    return water.item() if hasattr(water, "item") else water
+
+# Test
+print("\n--- Vectorized (many profiles) ---")
+profiles = [
+    [0, 1, 0, 2, 1, 0, 1, 3, 2, 1, 2, 1],
+    [4, 2, 0, 3, 2, 5, 0, 0, 0, 0, 0, 0],
+    [3, 0, 3, 0, 3, 0, 3, 0, 3, 0, 3, 0],
+]
+print(f"Batch: {[int(w) for w in trap_water_batch(profiles)]}")
+print("Expected: [6, 9, 15]")
+print(f"trap_water_np(elevation) = {trap_water_np(elevation)}")  # 6
+print(f"Float terrain: {trap_water_np([2.5, 0, 2.5])}")  # 2.5 (not truncated)
+
+
+def benchmark_trap_water(rows=2_000, cols=1_000, seed=5):
+    """
+    Python two-pointer loop per row vs one vectorized batch call
+    Full size: benchmark_trap_water(rows=100_000, cols=10_000)
+    """
+    import random
+    rng = random.Random(seed)
+    terrain = [[rng.randint(0, 100) for _ in range(cols)] for _ in range(rows)]
+
+    start = time.time()
+    expected = [trap_water(row) for row in terrain]
+    loop_time = time.time() - start
+
+    if np is None:
+        print(f"Loop: {loop_time:.4f}s (install NumPy for the batch path)")
+        return
+    grid = np.array(terrain, dtype=np.int64)
+
+    start = time.time()
+    got = trap_water_batch(grid)
+    batch_time = time.time() - start
+
+    assert got.tolist() == expected
+    print(f"{rows} profiles × {cols} columns")
+    print(f"Loop:  {loop_time:.4f}s")
+    print(f"Batch: {batch_time:.4f}s ({loop_time / batch_time:.1f}x faster)")
+
+if __name__ == "__main__":
+    benchmark_trap_water()
+
+# ----------------------------------------------------------------------------
+# Trapping Rain Water II: 2-D terrain
+# ----------------------------------------------------------------------------
+"""
+In 2-D, water escapes through the LOWEST point of the surrounding wall
+→ Flood fill inward from the border, always from the lowest wall (min-heap)
+
+    1. Push every border cell (it can't hold water)
+    2. Pop lowest cell: its height is the current water level
+    3. Each unvisited neighbour holds max(0, level - height) water,
+       then becomes part of the wall at max(level, height)
+"""
+
+def trap_rain_water_2d(grid) -> int:
+    """
+    Total water trapped on a 2-D elevation map
+
+    Args:
+        grid: list of rows or 2-D NumPy array of heights
+
+    Returns:
+        int: Total water trapped
+
+    Time: O(R·C log(R·C)), Space: O(R·C)
+
+    Visited state is one flat bytearray (1 byte per cell) instead of a
+    set of (row, col) tuples; cell (r, c) lives at index r * cols + c
+    """
+    if np is not None and isinstance(grid, np.ndarray):
+        rows, cols = grid.shape
+        heights = grid.ravel().tolist()
+    else:
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        heights = [h for row in grid for h in row]
+    if rows < 3 or cols < 3:
+        return 0
+
+    visited = bytearray(rows * cols)
+    heap = []
+    for r in range(rows):
+        for c in (0, cols - 1):
+            i = r * cols + c
+            visited[i] = 1
+            heap.append((heights[i], i))
+    for c in range(1, cols - 1):
+        for r in (0, rows - 1):
+            i = r * cols + c
+            visited[i] = 1
+            heap.append((heights[i], i))
+    heapq.heapify(heap)
+
+    water = 0
+    while heap:
+        level, i = heapq.heappop(heap)
+        r, c = divmod(i, cols)
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < rows and 0 <= nc < cols:
+                j = nr * cols + nc
+                if not visited[j]:
+                    visited[j] = 1
+                    h = heights[j]
+                    if h < level:
+                        water += level - h
+                        h = level
+                    heapq.heappush(heap, (h, j))
+
+    return water
+
+# Test
+print("\n--- Trapping Rain Water II (2-D) ---")
+height_map = [
+    [1, 4, 3, 1, 3, 2],
+    [3, 2, 1, 3, 2, 4],
+    [2, 3, 3, 2, 3, 1],
+]
+print(f"Water trapped: {trap_rain_water_2d(height_map)}")
+print("Expected: 4")
+
+bowl = [
+    [3, 3, 3, 3, 3],
+    [3, 2, 2, 2, 3],
+    [3, 2, 1, 2, 3],
+    [3, 2, 2, 2, 3],
+    [3, 3, 3, 3, 3],
+]
+print(f"Bowl: {trap_rain_water_2d(bowl)}")
+print("Expected: 10")
+
 # ============================================================================
 # PROBLEM 4: PRODUCT OF ARRAY EXCEPT SELF
 # ============================================================================
@@ -279,6 +481,170 @@ result = product_except_self(nums)
 print(f"Output: {result}")
 print("Expected: [24, 12, 8, 6]")
 
+# ----------------------------------------------------------------------------
+# Vectorized and log-space modes
+# ----------------------------------------------------------------------------
+"""
+Vectorized: the two passes ARE prefix/suffix products → np.cumprod
+    prefix[i] = nums[0] * ... * nums[i-1]
+    suffix[i] = nums[i+1] * ... * nums[n-1]
+    answer    = prefix * suffix
+Works along the last axis, so rows of a 2-D array are done in one call
+
+Catch: a million floats multiplied together is inf or 0.0 long before the
+end, and int64 cumprod wraps around silently. Log-space fixes floats:
+    log|answer[i]| = sum(log|nums|) - log|nums[i]|
+    sign[i]        = (-1)^(negatives) * sign(nums[i])
+Zeros can't go through log, so count them per row:
+    0 zeros → formula above
+    1 zero  → only the zero's position gets the product of the others
+    2+      → every answer is 0
+"""
+
+import math
+
+
+def product_except_self_np(nums, dtype=None):
+    """
+    cumprod version for a vector or a 2-D batch (one vector per row)
+
+    Integer dtypes are checked for overflow first: auto dtype switches to
+    exact Python ints (object dtype), an explicit dtype raises OverflowError
+    """
+    if np is None:
+        raise ImportError("NumPy is required for product_except_self_np")
+
+    values = np.asarray(nums)
+    explicit = dtype is not None
+    if dtype is None:
+        dtype = np.float64 if values.dtype.kind in "fc" else np.int64
+    dtype = np.dtype(dtype)
+
+    # Worst case |answer| <= product of all |x| > 1  → count the bits
+    if dtype.kind in "iu" and values.size:
+        magnitudes = np.abs(values.astype(np.float64))
+        bits = np.log2(np.maximum(magnitudes, 1.0)).sum(axis=-1)
+        if np.max(bits) >= np.iinfo(dtype).bits - 1 or (dtype.kind == "u" and values.min() < 0):
+            if explicit:
+                raise OverflowError(f"products may not fit in {dtype}")
+            dtype = np.dtype(object)  # exact, but slower
+
+    values = values.astype(dtype)
+    prefix = np.ones_like(values)
+    suffix = np.ones_like(values)
+    if values.shape[-1] > 1:
+        prefix[..., 1:] = np.cumprod(values[..., :-1], axis=-1)
+        suffix[..., :-1] = np.cumprod(values[..., :0:-1], axis=-1)[..., ::-1]
+    return prefix * suffix
+
+
+def product_except_self_log(nums, as_float=False):
+    """
+    Log-space product except self (stable on million-element float vectors)
+
+    Args:
+        nums: vector, or 2-D batch with one vector per row
+        as_float: return sign * exp(log_abs) instead of the pair
+
+    Returns:
+        (sign, log_abs): answer[i] = sign[i] * exp(log_abs[i]),
+        sign 0 / log_abs -inf where the answer is exactly 0
+
+    Time: O(n), Space: O(n)
+    """
+    if np is None:
+        return product_except_self_log_py(nums, as_float)
+
+    values = np.asarray(nums, dtype=np.float64)
+    is_zero = values == 0
+    zeros = is_zero.sum(axis=-1, keepdims=True)
+
+    with np.errstate(divide="ignore"):
+        logs = np.log(np.abs(values))                      # -inf at zeros
+    nonzero_logs = np.where(is_zero, 0.0, logs)
+    total_log = nonzero_logs.sum(axis=-1, keepdims=True)  # pairwise sum
+    negatives = (values < 0).sum(axis=-1, keepdims=True)
+    total_sign = np.where(negatives % 2, -1.0, 1.0)
+
+    # No zeros: divide out nums[i]; one zero: only that slot is non-zero
+    log_abs = np.where(zeros == 0, total_log - nonzero_logs, -np.inf)
+    sign = np.where(zeros == 0, total_sign * np.sign(values), 0.0)
+    only_zero = is_zero & (zeros == 1)
+    log_abs = np.where(only_zero, total_log, log_abs)
+    sign = np.where(only_zero, total_sign, sign)
+
+    if as_float:
+        with np.errstate(over="ignore"):
+            return sign * np.exp(log_abs)
+    return sign, log_abs
+
+
+def product_except_self_log_py(nums, as_float=False):
+    """Pure-Python log-space version (1-D), used when NumPy is missing"""
+    zeros = nums.count(0)
+    total_log = math.fsum(math.log(abs(x)) for x in nums if x != 0)
+    total_sign = -1.0 if sum(1 for x in nums if x < 0) % 2 else 1.0
+
+    sign, log_abs = [], []
+    for x in nums:
+        if zeros == 0:
+            sign.append(total_sign * (1.0 if x > 0 else -1.0))
+            log_abs.append(total_log - math.log(abs(x)))
+        elif zeros == 1 and x == 0:
+            sign.append(total_sign)
+            log_abs.append(total_log)
+        else:
+            sign.append(0.0)
+            log_abs.append(-math.inf)
+
+    if as_float:
+        return [s * math.exp(l) if l < 709 else s * math.inf for s, l in zip(sign, log_abs)]
+    return sign, log_abs
+
+
+def product_except_self_batch(rows, mode="cumprod"):
+    """
+    Many vectors at once (rows of a 2-D array)
+
+    mode="cumprod": exact for ints (see product_except_self_np)
+    mode="log":     (sign, log_abs) arrays, for long float vectors
+    """
+    if mode not in ("cumprod", "log"):
+        raise ValueError("mode must be 'cumprod' or 'log'")
+    if np is None:
+        if mode == "log":
+            pairs = [product_except_self_log_py(list(row)) for row in rows]
+            return [s for s, _ in pairs], [l for _, l in pairs]
+        return [product_except_self(list(row)) for row in rows]
+
+    rows = np.asarray(rows)
+    if rows.ndim != 2:
+        raise ValueError("rows must be 2-D: one vector per row")
+    if mode == "log":
+        return product_except_self_log(rows)
+    return product_except_self_np(rows)
+
+# Test
+print("\n--- Vectorized / log-space ---")
+batch = [[1, 2, 3, 4], [2, 0, 5, 1], [0, 3, 0, 2], [-1, 2, -3, 4]]
+if np is not None:
+    print(f"cumprod batch: {product_except_self_batch(batch).tolist()}")
+else:
+    print(f"cumprod batch: {product_except_self_batch(batch)}")
+# [[24, 12, 8, 6], [0, 10, 0, 0], [0, 0, 0, 0], [-24, 12, -8, 6]]
+
+sign, log_abs = product_except_self_log([1.0, 2.0, 3.0, 4.0])
+print(f"log-space: {[round(float(s) * math.exp(l), 6) for s, l in zip(sign, log_abs)]}")
+# [24.0, 12.0, 8.0, 6.0]
+
+# Long vector: plain products overflow to inf, log-space stays finite
+long_vector = [1.5] * 1_000_000
+long_vector[10] = 0.5
+sign, log_abs = product_except_self_log(long_vector)
+print(f"1M × 1.5: log|answer[10]| = {float(log_abs[10]):.2f}, "
+      f"log|answer[0]| = {float(log_abs[0]):.2f}")
+# ≈ 405464.70 (= 999999·ln 1.5) and ≈ 405463.60 (one 1.5 swapped for 0.5)
+
 # ============================================================================
 # PROBLEM 5: MAXIMUM SUBARRAY SUM (Kadane's Algorithm)
 # ============================================================================
@@ -399,6 +765,175 @@ result = merge_intervals(intervals)
 print(f"Output: {result}")
 print("Expected: [[1, 6], [8, 10], [15, 18]]")
 
+# ----------------------------------------------------------------------------
+# Keeping intervals merged as they arrive: IntervalSet
+# ----------------------------------------------------------------------------
+"""
+Re-running merge_intervals after every new booking = O(n log n) per insert
+Instead keep the merged, disjoint intervals in two sorted arrays:
+
+    starts = [1, 8, 15]
+    ends   = [6, 10, 18]
+
+Because they're disjoint, BOTH arrays are sorted → binary search either one
+    add [5, 9]:  overlaps index 0..1 → replace them with [1, 10]
+    stab 9:      last start <= 9 is 8, its end 10 >= 9 → [8, 10]
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class IntervalSet:
+    """
+    Merged disjoint [start, end] intervals in sorted arrays
+
+    Same merge rule as merge_intervals: touching intervals join
+    ([1, 3] + [3, 5] → [1, 5])
+
+    add / remove: O(log n + m) to find the m affected intervals,
+                  plus one slice replacement (a C-level memmove)
+    stab / overlapping: O(log n + m)
+    """
+    def __init__(self, intervals=None):
+        self.starts = []
+        self.ends = []
+        if intervals:
+            self.load_merged(merge_intervals([list(iv) for iv in intervals]))
+
+    @classmethod
+    def from_merged(cls, merged):
+        """Bulk-load output of merge_intervals in O(n) (no re-sorting)"""
+        interval_set = cls()
+        interval_set.load_merged(merged)
+        return interval_set
+
+    def load_merged(self, merged):
+        """Replace contents with already merged, sorted intervals"""
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+        for i in range(1, len(self.starts)):
+            if self.starts[i] <= self.ends[i - 1]:
+                raise ValueError("intervals must be sorted and disjoint")
+
+    def add(self, start, end):
+        """Insert [start, end], merging everything it overlaps or touches"""
+        if start > end:
+            raise ValueError("start must be <= end")
+        i = bisect_left(self.ends, start)      # first with end >= start
+        j = bisect_right(self.starts, end)     # past last with start <= end
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+
+    def remove(self, start, end):
+        """
+        Free the span between start and end
+
+        Like booking slots, the boundaries stay with the neighbours:
+        removing [3, 5] from [1, 8] leaves [1, 3] and [5, 8]
+        So a zero-width span ([4, 4]) frees nothing: splitting there
+        would leave touching pieces [1, 4] and [4, 8]
+        """
+        if start > end:
+            raise ValueError("start must be <= end")
+        if start == end:
+            return
+        i = bisect_right(self.ends, start)     # first with end > start
+        j = bisect_left(self.starts, end)      # past last with start < end
+        if i >= j:
+            return
+        new_starts, new_ends = [], []
+        if self.starts[i] < start:
+            new_starts.append(self.starts[i])
+            new_ends.append(start)
+        if self.ends[j - 1] > end:
+            new_starts.append(end)
+            new_ends.append(self.ends[j - 1])
+        self.starts[i:j] = new_starts
+        self.ends[i:j] = new_ends
+
+    def stab(self, point):
+        """Interval covering point, or None"""
+        i = bisect_right(self.starts, point) - 1
+        if i >= 0 and self.ends[i] >= point:
+            return [self.starts[i], self.ends[i]]
+        return None
+
+    def overlapping(self, start, end):
+        """All intervals sharing at least one point with [start, end]"""
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+        return [[self.starts[k], self.ends[k]] for k in range(i, j)]
+
+    def __contains__(self, point):
+        return self.stab(point) is not None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return ([s, e] for s, e in zip(self.starts, self.ends))
+
+    def to_list(self):
+        return list(self)
+
+    def __repr__(self):
+        return f"IntervalSet({self.to_list()})"
+
+# Test
+print("\n--- IntervalSet ---")
+bookings = IntervalSet.from_merged(merge_intervals([[1, 3], [2, 6], [8, 10], [15, 18]]))
+print(bookings)                             # [[1, 6], [8, 10], [15, 18]]
+bookings.add(5, 9)
+print(f"add [5, 9]     → {bookings}")       # [[1, 10], [15, 18]]
+bookings.add(12, 13)
+print(f"add [12, 13]   → {bookings}")       # [[1, 10], [12, 13], [15, 18]]
+bookings.remove(3, 5)
+print(f"remove [3, 5]  → {bookings}")       # [[1, 3], [5, 10], [12, 13], [15, 18]]
+print(f"stab 9  → {bookings.stab(9)}")      # [5, 10]
+print(f"stab 11 → {bookings.stab(11)}")     # None
+print(f"overlapping [9, 15] → {bookings.overlapping(9, 15)}")
+# [[5, 10], [12, 13], [15, 18]]
+
+single = IntervalSet([[1, 8]])
+single.remove(4, 4)
+print(f"remove [4, 4] from [1, 8] → {single}")  # [[1, 8]] (no touching pieces)
+assert single.to_list() == [[1, 8]]
+IntervalSet.from_merged(single.to_list())  # still a valid merged state
+
+
+def benchmark_interval_set(inserts=2_000, seed=17):
+    """Re-merge the whole list after every insert vs IntervalSet.add"""
+    import random
+    rng = random.Random(seed)
+    new_bookings = []
+    for _ in range(inserts):
+        start = rng.randint(0, inserts * 100)
+        new_bookings.append([start, start + rng.randint(1, 40)])
+
+    start_time = time.time()
+    all_bookings, merged = [], []
+    for booking in new_bookings:
+        all_bookings.append(list(booking))
+        merged = merge_intervals(all_bookings)
+    remerge_time = time.time() - start_time
+
+    start_time = time.time()
+    interval_set = IntervalSet()
+    for s, e in new_bookings:
+        interval_set.add(s, e)
+    set_time = time.time() - start_time
+
+    assert interval_set.to_list() == merged
+    print(f"{inserts} inserts, {len(merged)} merged intervals")
+    print(f"Re-merge each time: {remerge_time:.4f}s")
+    print(f"IntervalSet.add:    {set_time:.4f}s ({remerge_time / set_time:.0f}x faster)")
+
+if __name__ == "__main__":
+    benchmark_interval_set()
+
 # ============================================================================
 # COMPLEXITY SUMMARY
 # ============================================================================
@@ -413,9 +948,13 @@ Problem                      Time         Space    Technique
 Three Sum                    O(n²)        O(1)     Sort + 2-Pointer
 Container Water              O(n)         O(1)     2-Pointer
 Trapping Rain Water          O(n)         O(1)     2-Pointer + Max
+Rain Water (batch rows)      O(R·C)       O(block) Running Max (NumPy)
+Rain Water II (2-D)          O(RC log RC) O(RC)    Min-Heap Flood Fill
 Product Except Self          O(n)         O(1)     Prefix/Suffix
+Product (cumprod / log)      O(n)         O(n)     cumprod, Log-Sum + Zero Count
 Max Subarray (Kadane)        O(n)         O(1)     DP + Greedy
 Merge Intervals              O(n log n)   O(n)     Sort + Merge
+IntervalSet add/stab         O(log n + m) O(n)     Sorted Arrays + Bisect
 """
 
 print(summary)
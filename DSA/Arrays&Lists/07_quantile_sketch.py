@@ -0,0 +1,256 @@
+"""
+Arrays & Lists - Approximate Kth Largest / Quantiles (KLL Sketch)
+=================================================================
+When even an O(k) heap is too big: k = 1% of a billion is 10 million!
+Trade a tiny, bounded rank error for O(1/ε) memory
+"""
+
+import importlib.util
+import io
+import math
+import random
+import sys
+import time
+from bisect import bisect_right
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# ============================================================================
+# THE IDEA: COMPACTORS
+# ============================================================================
+"""
+Keep a few small buffers ("compactors"), one per level
+An item stored at level h stands for 2^h original items (its weight)
+
+When a buffer gets full:
+    sort it → keep every OTHER item (random start) → move them up a level
+    [1, 3, 4, 7, 8, 9]  →  [3, 7, 9] at level h+1 (each now weighs double)
+
+Each compaction shifts ranks by at most one weight unit, randomly up or
+down, so errors cancel out. Lower levels are smaller (capacity shrinks by
+2/3 per level going down, but never below 8 items), which keeps total
+memory at about 3k items plus 8 per level.
+
+KLL = Karnin, Lang, Liberty (2016)
+Normalized rank error ≈ 1/k → choose k ≈ 2/ε for error bound ε
+"""
+
+# ============================================================================
+# KLL SKETCH
+# ============================================================================
+
+class KLLSketch:
+    """
+    Mergeable quantile sketch with bounded memory
+
+    Args:
+        epsilon: target rank error as a fraction of n (0.01 = 1%)
+        seed: makes compaction coin flips reproducible
+
+    update: O(log k) amortized (no growth with n),
+    memory: O(1/ε + log n) items
+    """
+    MIN_CAPACITY = 8  # bottom levels would shrink to 2 → compress every few items
+
+    def __init__(self, epsilon=0.01, seed=None):
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be between 0 and 1")
+        self.epsilon = epsilon
+        self.k = max(8, math.ceil(2 / epsilon))
+        self.n = 0
+        self.compactors = []
+        self.capacities = []
+        self.size = 0      # items stored, kept up to date incrementally
+        self.max_size = 0  # sum(self.capacities)
+        self.rng = random.Random(seed)
+        self.add_level()
+
+    def capacity(self, level):
+        """Top level holds k items, each level below holds 2/3 as many"""
+        depth = len(self.compactors) - level - 1
+        return max(self.MIN_CAPACITY, math.ceil(self.k * (2 / 3) ** depth))
+
+    def add_level(self):
+        """New top level; capacities only change here, so cache them"""
+        self.compactors.append([])
+        self.capacities = [self.capacity(h) for h in range(len(self.compactors))]
+        self.max_size = sum(self.capacities)
+
+    def update(self, value):
+        """Add one value from the stream"""
+        self.compactors[0].append(value)
+        self.size += 1
+        self.n += 1
+        if self.size >= self.max_size:
+            self.compress()
+
+    def extend(self, values):
+        """Consume any iterable (file, generator, list...)"""
+        for value in values:
+            self.update(value)
+        return self
+
+    def compress(self):
+        """Compact the first full level (half its items move up)"""
+        for level in range(len(self.compactors)):
+            if len(self.compactors[level]) >= self.capacities[level]:
+                if level + 1 == len(self.compactors):
+                    self.add_level()
+                buffer = sorted(self.compactors[level])
+
+                # Odd count: one item stays behind at this level
+                leftover = [buffer.pop()] if len(buffer) % 2 else []
+                start = self.rng.randint(0, 1)
+                self.compactors[level + 1].extend(buffer[start::2])
+                self.compactors[level] = leftover
+                self.size -= len(buffer) // 2  # half of the pairs move up
+                break
+
+    def merge(self, other):
+        """Absorb another sketch (e.g. from another shard); returns self"""
+        while len(self.compactors) < len(other.compactors):
+            self.add_level()
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.n += other.n
+        self.size += other.size
+
+        while self.size >= self.max_size:
+            self.compress()
+        return self
+
+    def weighted_items(self):
+        """Sorted (value, weight) pairs: level h items weigh 2^h"""
+        pairs = []
+        for level, items in enumerate(self.compactors):
+            pairs.extend((value, 1 << level) for value in items)
+        pairs.sort()
+        return pairs
+
+    def kth_smallest(self, rank):
+        """Approximate value with `rank` items <= it (1-indexed)"""
+        if self.n == 0 or not 1 <= rank <= self.n:
+            return None
+        seen = 0
+        for value, weight in self.weighted_items():
+            seen += weight
+            if seen >= rank:
+                return value
+        return value
+
+    def kth_largest(self, k):
+        """Approximate kth largest: kth largest = (n-k+1)th smallest"""
+        if not 1 <= k <= self.n:
+            return None
+        return self.kth_smallest(self.n - k + 1)
+
+    def quantile(self, q):
+        """Approximate q-quantile, 0 <= q <= 1 (0.5 = median)"""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        return self.kth_smallest(max(1, math.ceil(q * self.n)))
+
+    def retained(self):
+        """Items actually stored (the memory footprint)"""
+        return self.size
+
+
+def kth_largest_approx(stream, k, epsilon=0.01, seed=None):
+    """Approximate Kth largest of a stream with O(1/ε) memory"""
+    return KLLSketch(epsilon, seed).extend(stream).kth_largest(k)
+
+
+def quantile(stream, q, epsilon=0.01, seed=None):
+    """Approximate q-quantile of a stream with O(1/ε) memory"""
+    return KLLSketch(epsilon, seed).extend(stream).quantile(q)
+
+# Test
+print("--- KLL Sketch ---")
+data = list(range(1, 100_001))
+random.Random(1).shuffle(data)
+
+sketch = KLLSketch(epsilon=0.01, seed=1).extend(data)
+print(f"n = {sketch.n}, items kept = {sketch.retained()}")
+print(f"Median ≈ {sketch.quantile(0.5)} (exact 50000)")
+print(f"p99    ≈ {sketch.quantile(0.99)} (exact 99000)")
+print(f"1000th largest ≈ {sketch.kth_largest(1000)} (exact 99001)")
+
+# Shards: one sketch per shard, merged at the end
+left = KLLSketch(0.01, seed=2).extend(data[:50_000])
+right = KLLSketch(0.01, seed=3).extend(data[50_000:])
+merged = left.merge(right)
+print(f"Merged median ≈ {merged.quantile(0.5)}, n = {merged.n}")
+
+# ============================================================================
+# BENCHMARK: ACCURACY & THROUGHPUT vs EXACT kth_largest_heap
+# ============================================================================
+
+def load_exact_kth_largest_heap():
+    """kth_largest_heap from 05_kth_largest.py (its demo output silenced)"""
+    path = Path(__file__).with_name("05_kth_largest.py")
+    spec = importlib.util.spec_from_file_location("kth_largest_05", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # its TopK demo pickles by module name
+    with redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module.kth_largest_heap
+
+
+def benchmark_sketch(n=200_000, epsilon=0.01, percentiles=(50, 90, 99, 99.9), seed=37):
+    """
+    Rank error and time: exact heap (O(k) memory) vs KLL (O(1/ε) memory)
+    rank error = |true rank of the answer - wanted rank| / n
+    """
+    kth_largest_heap = load_exact_kth_largest_heap()
+    rng = random.Random(seed)
+    data = [rng.gauss(0, 1000) for _ in range(n)]
+    ordered = sorted(data)
+
+    start = time.time()
+    sketch = KLLSketch(epsilon, seed).extend(data)
+    sketch_time = time.time() - start
+    print(f"n = {n}, ε = {epsilon}")
+    print(f"Sketch build: {sketch_time:.4f}s ({n / sketch_time:,.0f} items/s), "
+          f"{sketch.retained()} items kept")
+
+    print(f"{'pct':>6} {'k':>7} {'heap s':>8} {'heap items':>10} {'rank err':>9}")
+    for pct in percentiles:
+        k = max(1, round(n * (1 - pct / 100)))
+
+        start = time.time()
+        exact = kth_largest_heap(data, k)
+        heap_time = time.time() - start
+
+        approx = sketch.kth_largest(k)
+        wanted = n - k + 1
+        got = bisect_right(ordered, approx)
+        error = abs(got - wanted) / n
+
+        assert exact == ordered[n - k]
+        assert error <= 3 * epsilon, "rank error far above the bound"
+        print(f"{pct:>6} {k:>7} {heap_time:8.4f} {k:>10} {error:9.5f}")
+
+if __name__ == "__main__":
+    print("\n--- Benchmark: KLL sketch vs exact heap ---")
+    benchmark_sketch()
+
+# ============================================================================
+# KEY TAKEAWAYS
+# ============================================================================
+"""
+EXACT vs APPROXIMATE Kth LARGEST:
+
+Exact heap (kth_largest_heap):
+✓ Time: O(n log k), Space: O(k)
+✓ k = 1% of 2 billion → 20 million items in RAM
+
+KLL sketch:
+✓ Time: O(n log k), Space: O(1/ε + log n) (≈ 3k items plus 8 per level)
+✓ Answer's rank is within about ε·n of the true rank
+✓ Mergeable: sketch each shard, merge, query once
+✓ Any quantile from ONE sketch (p50, p90, p99 ...)
+
+WHEN TO USE:
+- Need the exact value, k small → heap
+- Percentiles over huge or unbounded streams → sketch
+"""
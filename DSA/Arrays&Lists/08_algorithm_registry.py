@@ -0,0 +1,305 @@
+"""
+Arrays & Lists - Algorithm Registry & Differential Benchmark
+=============================================================
+The same problem is solved in several files (three_sum x3, move_zeros x3...)
+Which one is right? Which one is fastest? Measure, don't guess!
+"""
+
+import importlib.util
+import io
+import json
+import platform
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# ============================================================================
+# LOADING THE OTHER FILES
+# ============================================================================
+"""
+File names start with digits (02_insertion_deletion.py) → no plain import
+importlib loads them by path; their demo prints are silenced
+Loaded once, cached in sys.modules (process pools can pickle their functions)
+"""
+
+HERE = Path(__file__).parent
+
+
+def load_module(filename):
+    """Import a sibling file by name, e.g. load_module("04_two_pointers.py")"""
+    name = "arrays_" + Path(filename).stem
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, HERE / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        with redirect_stdout(io.StringIO()):
+            spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+# ============================================================================
+# THE REGISTRY
+# ============================================================================
+"""
+One entry per PROBLEM:
+    make_input(size, rng) → fresh random input
+    min_size / max_size   → smallest valid input, skip sizes an O(n²)
+                            solution can't finish
+    implementations       → name → (source, runner)
+
+Runners adapt each calling convention to ONE canonical answer:
+    in-place functions run on a copy, the modified list is the answer
+    remove_duplicates returns a length → answer is arr[:length]
+    three_sum triplet order differs   → answer is a sorted list of tuples
+"""
+
+REGISTRY = {}
+
+
+def register_problem(problem, make_input, min_size=0, max_size=None):
+    REGISTRY[problem] = {
+        "make_input": make_input,
+        "min_size": min_size,
+        "max_size": max_size,
+        "implementations": {},
+    }
+
+
+def register(problem, name, source, runner):
+    """Tag an implementation with its problem; first one is the reference"""
+    REGISTRY[problem]["implementations"][name] = (source, runner)
+
+
+def canonical_triplets(triplets):
+    return sorted(tuple(t) for t in triplets)
+
+
+def prefix_after(func):
+    """Runner for 'remove in place, return new length' functions"""
+    def run(arr):
+        length = func(arr)
+        return arr[:length]
+    return run
+
+
+def build_registry():
+    """Load every file and register its implementations"""
+    insertion = load_module("02_insertion_deletion.py")
+    searching = load_module("03_searching_duplicates.py")
+    pointers = load_module("04_two_pointers.py")
+    advanced = load_module("06_advanced_problems.py")
+    algorithms = load_module("arrays_algorithms.py")
+
+    # Three Sum (target 0)
+    register_problem(
+        "three_sum",
+        lambda size, rng: [rng.randint(-size, size) for _ in range(size)],
+        max_size=2_000,
+    )
+    register("three_sum", "two_pointers", "04_two_pointers.py:three_sum",
+             lambda arr: canonical_triplets(pointers.three_sum(arr)))
+    register("three_sum", "advanced", "06_advanced_problems.py:three_sum",
+             lambda arr: canonical_triplets(advanced.three_sum(arr)))
+    register("three_sum", "n_sum", "arrays_algorithms.py:three_sum",
+             lambda arr: canonical_triplets(algorithms.three_sum(arr, 0)))
+    register("three_sum", "n_sum_slicing", "arrays_algorithms.py:n_sum_slicing",
+             lambda arr: canonical_triplets(algorithms.n_sum_slicing(arr, 0, 3)))
+
+    # Move Zeros (order of non-zeros kept)
+    register_problem(
+        "move_zeros",
+        lambda size, rng: [rng.choice((0, 0, 0, rng.randint(1, 99))) for _ in range(size)],
+    )
+    register("move_zeros", "new_array", "02_insertion_deletion.py:move_zeros_method1",
+             insertion.move_zeros_method1)
+    register("move_zeros", "overwrite", "02_insertion_deletion.py:move_zeros_inplace",
+             insertion.move_zeros_inplace)
+    register("move_zeros", "swap", "02_insertion_deletion.py:move_zeros_swap",
+             insertion.move_zeros_swap)
+    register("move_zeros", "two_pointers", "04_two_pointers.py:move_zeros",
+             pointers.move_zeros)
+    register("move_zeros", "algorithms", "arrays_algorithms.py:move_zeros",
+             algorithms.move_zeros)
+
+    # Remove Duplicates (sorted input)
+    register_problem(
+        "remove_duplicates",
+        lambda size, rng: sorted(rng.randint(0, size // 3 + 1) for _ in range(size)),
+    )
+    register("remove_duplicates", "searching", "03_searching_duplicates.py:remove_duplicates",
+             prefix_after(searching.remove_duplicates))
+    register("remove_duplicates", "two_pointers", "04_two_pointers.py:remove_duplicates",
+             prefix_after(pointers.remove_duplicates))
+    register("remove_duplicates", "algorithms", "arrays_algorithms.py:remove_duplicates",
+             prefix_after(algorithms.remove_duplicates))
+
+    # Maximum Subarray Sum
+    register_problem(
+        "max_subarray_sum",
+        lambda size, rng: [rng.randint(-100, 100) for _ in range(size)],
+        min_size=1,  # max_subarray_sum reads nums[0]
+    )
+    register("max_subarray_sum", "advanced", "06_advanced_problems.py:max_subarray_sum",
+             advanced.max_subarray_sum)
+    register("max_subarray_sum", "kadanes", "arrays_algorithms.py:kadanes",
+             algorithms.kadanes)
+    register("max_subarray_sum", "kadanes_span", "arrays_algorithms.py:kadanes_span",
+             lambda arr: algorithms.kadanes_span(arr)[0])
+
+    return REGISTRY
+
+# ============================================================================
+# DIFFERENTIAL CHECK + TIMING
+# ============================================================================
+
+def check_agreement(problem, trials=200, max_trial_size=40, seed=0):
+    """
+    Run every implementation on the same random inputs
+
+    Returns:
+        list of mismatches: {"implementation", "size", "seed"}
+        (replay one with make_input(size, random.Random(seed)))
+    """
+    entry = REGISTRY[problem]
+    names = list(entry["implementations"])
+    mismatches = []
+    for trial in range(trials):
+        trial_seed = seed * 1_000_003 + trial
+        size = random.Random(trial_seed).randint(entry["min_size"], max_trial_size)
+        data = entry["make_input"](size, random.Random(trial_seed))
+
+        expected = entry["implementations"][names[0]][1](list(data))
+        for name in names[1:]:
+            if entry["implementations"][name][1](list(data)) != expected:
+                mismatches.append({"implementation": name, "size": size, "seed": trial_seed})
+    return mismatches
+
+
+def time_implementations(problem, size, repeat=3, seed=1):
+    """
+    Best-of-`repeat` seconds per implementation at one input size
+    Each run gets a fresh copy (copying isn't timed); answers are compared
+    """
+    entry = REGISTRY[problem]
+    data = entry["make_input"](size, random.Random(seed))
+    timings, answers = {}, {}
+    for name, (_, runner) in entry["implementations"].items():
+        best = float("inf")
+        for _ in range(repeat):
+            arr = list(data)
+            start = time.perf_counter()
+            answer = runner(arr)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+        answers[name] = answer
+
+    reference = next(iter(answers.values()))
+    disagree = [name for name, answer in answers.items() if answer != reference]
+    return timings, disagree
+
+
+def run_benchmarks(sizes=(100, 1_000, 10_000), repeat=3, trials=200, problems=None):
+    """
+    Full differential benchmark → JSON-ready report (dict)
+
+    Full range: run_benchmarks(sizes=(10**2, 10**3, 10**4, 10**5, 10**6, 10**7))
+    (sizes above a problem's max_size are recorded as null = skipped)
+    """
+    if not REGISTRY:
+        build_registry()
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": list(sizes),
+        "repeat": repeat,
+        "problems": {},
+    }
+    for problem in problems or REGISTRY:
+        entry = REGISTRY[problem]
+        mismatches = check_agreement(problem, trials=trials)
+        implementations = {
+            name: {"source": source, "seconds": {}, "agrees": True}
+            for name, (source, _) in entry["implementations"].items()
+        }
+        for mismatch in mismatches:
+            implementations[mismatch["implementation"]]["agrees"] = False
+
+        fastest = {}
+        for size in sizes:
+            if entry["max_size"] is not None and size > entry["max_size"]:
+                for info in implementations.values():
+                    info["seconds"][str(size)] = None
+                continue
+            timings, disagree = time_implementations(problem, size, repeat=repeat)
+            for name, seconds in timings.items():
+                implementations[name]["seconds"][str(size)] = seconds
+            for name in disagree:
+                implementations[name]["agrees"] = False
+                mismatches.append({"implementation": name, "size": size, "seed": 1})
+            candidates = {n: s for n, s in timings.items() if implementations[n]["agrees"]}
+            if candidates:
+                fastest[str(size)] = min(candidates, key=candidates.get)
+
+        # Recommend the winner at the largest size actually measured
+        recommended = fastest[max(fastest, key=int)] if fastest else None
+        report["problems"][problem] = {
+            "reference": next(iter(implementations)),
+            "implementations": implementations,
+            "mismatches": mismatches,
+            "fastest": fastest,
+            "recommended": recommended,
+        }
+    return report
+
+
+def save_report(report, path):
+    """Write the report as JSON (for CI, dashboards, diffing between runs)"""
+    Path(path).write_text(json.dumps(report, indent=2))
+
+
+def print_report(report):
+    """Human-readable table: milliseconds per implementation and size"""
+    sizes = report["sizes"]
+    for problem, result in report["problems"].items():
+        print(f"\n{problem}  (recommended: {result['recommended']})")
+        print(f"  {'implementation':<16}" + "".join(f"{n:>11}" for n in sizes) + "  agrees")
+        for name, info in result["implementations"].items():
+            cells = "".join(
+                f"{'-':>11}" if info["seconds"][str(n)] is None
+                else f"{info['seconds'][str(n)] * 1000:>9.2f}ms"
+                for n in sizes
+            )
+            print(f"  {name:<16}{cells}  {'✓' if info['agrees'] else '✗'}")
+
+# Test (script only: importing the harness must not load and time everything)
+if __name__ == "__main__":
+    print("--- Registry ---")
+    build_registry()
+    for problem, entry in REGISTRY.items():
+        print(f"{problem}: {', '.join(entry['implementations'])}")
+
+    print("\n--- Differential benchmark ---")
+    report = run_benchmarks(sizes=(100, 1_000, 10_000), trials=100)
+    print_report(report)
+
+    assert all(not r["mismatches"] for r in report["problems"].values()), "implementations disagree"
+    print("\nJSON report (excerpt):")
+    print(json.dumps({p: r["fastest"] for p, r in report["problems"].items()}, indent=2))
+
+# ============================================================================
+# KEY TAKEAWAYS
+# ============================================================================
+"""
+✓ One registry = one place that knows every variant of a problem
+✓ Differential testing: random inputs, all variants must agree
+  (a mismatch report gives size + seed → replay it exactly)
+✓ Time across sizes: the winner at n=100 is not always the winner at n=10^6
+✓ Machine-readable JSON → compare runs, pick production code with evidence
+"""
@@ -188,6 +188,99 @@ print(move_zeros([0, 1, 0, 3, 12]))
 # 4-Sum: 4 - 2 = 2 loops  → i, j + two pointers
 # 5-Sum: 5 - 2 = 3 loops  → i, j, k + two pointers
 
+# N-Sum Engine (index-based, no slicing)
+
+import numbers
+
+def n_sum(nums, target, n):
+    """
+    Find all unique N-tuples that sum to target
+
+    Steps:
+    1. Sort array ONCE (in-place)
+    2. Recurse on a start index instead of nums[i+1:] (no copies)
+    3. Prune with min/max bounds from a prefix-sum array
+    4. Two pointers for last two elements, skip duplicates at all levels
+
+    Pruning at level k (k numbers still to pick, starting at i):
+        smallest sum = nums[i] + ... + nums[i+k-1]  > target → break
+        largest sum  = nums[i] + last (k-1) numbers < target → continue
+
+    Pruning only runs for exact numbers (int, Fraction). With floats the
+    prefix sums round differently from target - nums[i] - ..., so a
+    bound can cut off a tuple the search would have matched:
+        prefix sum of [0.1, 0.2, 0.3] = 0.6000000000000001 > 0.6
+
+    Time: O(n^(N-1)) worst case, Space: O(n) (prefix) + O(N) (recursion)
+    """
+    nums.sort()
+    size = len(nums)
+    result = []
+
+    if n < 2 or size < n:
+        return result
+
+    # Bounds are only safe when sums are exact (no float rounding)
+    prune = all(isinstance(x, numbers.Rational) for x in nums)
+    prune = prune and isinstance(target, numbers.Rational)
+
+    # prefix[j] = sum(nums[:j]) → any window sum in O(1)
+    prefix = [0] * (size + 1)
+    for i in range(size):
+        prefix[i + 1] = prefix[i] + nums[i]
+
+    picked = []
+
+    def search(start, remaining, k):
+        # Whole range can't reach remaining → stop early
+        if prune:
+            if prefix[start + k] - prefix[start] > remaining:
+                return
+            if prefix[size] - prefix[size - k] < remaining:
+                return
+
+        # Base case: 2-Sum with two pointers
+        if k == 2:
+            left, right = start, size - 1
+            while left < right:
+                two_sum = nums[left] + nums[right]
+                if two_sum == remaining:
+                    result.append(picked + [nums[left], nums[right]])
+                    while left < right and nums[left] == nums[left+1]:
+                        left += 1
+                    while left < right and nums[right] == nums[right-1]:
+                        right -= 1
+                    left += 1
+                    right -= 1
+                elif two_sum < remaining:
+                    left += 1
+                else:
+                    right -= 1
+            return
+
+        # Recursive case: fix nums[i], solve (k-1)-Sum on i+1..end
+        for i in range(start, size - k + 1):
+            if i > start and nums[i] == nums[i-1]:
+                continue
+
+            if prune:
+                # Smallest k-sum from i is too big → all later i are bigger too
+                if prefix[i + k] - prefix[i] > remaining:
+                    break
+                # Largest k-sum using nums[i] is too small → try bigger nums[i]
+                if nums[i] + prefix[size] - prefix[size - k + 1] < remaining:
+                    continue
+
+            picked.append(nums[i])
+            search(i + 1, remaining - nums[i], k - 1)
+            picked.pop()
+
+    search(0, target, n)
+    return result
+
+print(n_sum([1, 0, -1, 0, -2, 2], 0, 4))
+# [[-2, -1, 1, 2], [-2, 0, 0, 2], [-1, 0, 0, 1]]
+
 
 def two_sum(nums, target):
     # step1 do sort
@@ -235,43 +328,14 @@ print(two_sum([2,-4,5,6,2,0,1], 4))
 
 """
 def three_sum(nums, target):
-    # step1 sort the given list
-    nums.sort()
-    result = []
-    n = len(nums)
-
-    # step2 N-2 nested loops
-    # writing for 3sum N-2=3-2=1 nested loop(i)
-    for i in range(n-2):
-        if i > 0 and nums[i] == nums[i-1]:
-            continue
-        
-        left = i + 1
-        right = n-1
-
-        remaining_target = target - nums[i]
-        while left < right:
-            two_sum = nums[left] + nums[right]
-
-            if two_sum == remaining_target:
-                result.append([nums[i], nums[left], nums[right]])
-
-                while left < right and nums[left] == nums[left+1]:
-                    left += 1
-                while left < right and nums[right] == nums[right-1]:
-                    right -= 1
-                left += 1
-                right -= 1
-
-            elif two_sum < remaining_target:
-                left += 1
-            else:
-                right -= 1
-
-    return result
+    # 3sum = 1 fixed number (i) + two pointers
+    # runs on the shared n_sum engine (sort once, index-based, pruned)
+    return n_sum(nums, target, 3)
             
 print(three_sum([1,-3,4,5,6], 2))
 # Output: Triplets that sum to 2
+print(three_sum([0.1, 0.2, 0.3, 0.6, -0.3], 0.6))
+# Output: [[-0.3, 0.3, 0.6], [0.1, 0.2, 0.3]] (floats: no bound pruning)
 """
 
 ---
@@ -287,44 +351,9 @@ print(three_sum([1,-3,4,5,6], 2))
 """
 
 def four_sum(nums, target):
-    # step1 do sort
-    nums.sort()
-    result = []
-    n = len(nums)
-
-    # step2 N-2 nested loops 
-    # (here for 4sum 4-2 = 2 nested loops we need i.e.., i and j)
-    # fix 1 number then two pointer, next do the same process we done for 3sum
-    for i in range(n-3):
-        if i > 0 and nums[i] == nums[i-1]:  # remove the duplicates
-            continue
-
-        for j in range(i+1, n-2):
-            if j > i+1 and nums[j] == nums[j-1]:
-                continue
-
-            left = j+1
-            right = n-1
-
-            remaining_target = target-nums[i]-nums[j]
-
-            while left < right:
-                two_sum = nums[left]+ nums[right]
-
-                if two_sum == remaining_target:
-                    result.append([nums[i], nums[j], nums[left], nums[right]])
-
-                    while left<right and nums[left] == nums[left+1]:
-                        left += 1
-                    while left<right and nums[right] == nums[right-1]:
-                        right -= 1
-                    left+=1
-                    right-=1
-                elif two_sum< remaining_target:
-                    left+=1
-                else:
-                    right-=1
-    return result
+    # 4sum = 2 fixed numbers (i, j) + two pointers
+    # runs on the shared n_sum engine (sort once, index-based, pruned)
+    return n_sum(nums, target, 4)
 
 print(four_sum([2,3,5,1,-5,-2,0], 4))
 # Output: Quadruplets that sum to 4
@@ -342,46 +371,9 @@ print(four_sum([2,3,5,1,-5,-2,0], 4))
 """
 
 def five_sum(nums, target):
-    #step1 sort nums
-    nums.sort()
-    result = []
-    n = len(nums)
-
-    # step2 N-2 nested loops (for 5sum 5-2 = 3 nested loops i.e.., i,j,k)
-    for i in range(n-4):
-        if i > 0 and nums[i] == nums[i-1]:
-            continue
-        for j in range(i+1, n-3):
-            if j > i+1 and nums[j] == nums[j-1]:
-                continue
-            for k in range(j+1, n-2):
-                if k > j+1 and nums[k] == nums[k-1]:
-                    continue
-
-                left = k+1
-                right = n-1
-
-                remaining_target = target-nums[i]-nums[j]-nums[k]
-
-                while left < right:
-                    two_sum = nums[left]+nums[right]
-
-                    if two_sum == remaining_target:
-                        result.append([nums[i], nums[j], nums[k], 
-                                     nums[left], nums[right]])
-
-                        while left < right and nums[left] == nums[left+1]:
-                            left+=1
-                        while left < right and nums[right] == nums[right-1]:
-                            right -= 1
-
-                        left+=1
-                        right-=1
-                    elif two_sum < remaining_target:
-                        left+=1
-                    else:
-                        right-=1
-    return result
+    # 5sum = 3 fixed numbers (i, j, k) + two pointers
+    # runs on the shared n_sum engine (sort once, index-based, pruned)
+    return n_sum(nums, target, 5)
 
 print(five_sum([1,2,3,4,5], 15))
 # Output: [[1, 2, 3, 4, 5]]
@@ -417,9 +409,13 @@ print(five_sum([1,2,3,4,5], 15))
 
 """
 
-def n_sum(nums, target, n):
+def n_sum_slicing(nums, target, n, on_call=None):
     """
-    Your pattern for ANY N-Sum!
+    Your pattern for ANY N-Sum! (original slicing version)
+
+    Kept as the baseline for benchmark_n_sum: nums[i+1:] copies
+    the array and re-sorts it at every recursion level.
+    on_call(nums) is called once per level (benchmark counts copies).
     
     Steps:
     1. Sort array
@@ -427,6 +423,8 @@ def n_sum(nums, target, n):
     3. Two pointers for last two elements
     4. Skip duplicates at all levels
     """
+    if on_call is not None:
+        on_call(nums)
     nums.sort()
     result = []
     
@@ -457,12 +455,77 @@ def n_sum(nums, target, n):
             continue
         
         # Recursively solve (N-1)-Sum
-        sub_results = n_sum(nums[i+1:], target - nums[i], n - 1)
+        sub_results = n_sum_slicing(nums[i+1:], target - nums[i], n - 1, on_call)
         
         for sub_result in sub_results:
             result.append([nums[i]] + sub_result)
     
     return result
+
+# Benchmark: slicing n_sum vs index-based n_sum
+
+import random
+import time
+import tracemalloc
+
+def benchmark_n_sum(size=120, n=4, value_range=10_000, seed=7, target=None):
+    """
+    Compare time and allocations of n_sum_slicing vs n_sum
+
+    copied = list elements allocated by nums[i+1:] across all levels
+    (the indexed engine allocates only the prefix array: size + 1).
+
+    What each part buys:
+    - Removing the copies is a constant factor: with a random target
+      (the default) both versions do the same O(n^(N-1)) search, and
+      the gap is only the slice/sort work per level.
+    - The big wins come from the min/max pruning, and only when the
+      target sits near the edge of the reachable range, e.g.
+          benchmark_n_sum(size=50_000, n=3, target=29_990)
+      There almost every branch is cut; a mid-range target cuts almost
+      nothing. Pruning is also off for float input (see n_sum).
+    """
+    rng = random.Random(seed)
+    data = [rng.randint(-value_range, value_range) for _ in range(size)]
+    if target is None:
+        target = rng.randint(-value_range, value_range)
+
+    # Every slicing level reports the list it got (the copy it was handed)
+    copied = [0]
+
+    def count_copy(nums):
+        copied[0] += len(nums)
+
+    runs = [
+        ("slicing", lambda nums: n_sum_slicing(nums, target, n, on_call=count_copy)),
+        ("indexed", lambda nums: n_sum(nums, target, n)),
+    ]
+    results = {}
+    for name, run in runs:
+        nums = data.copy()
+        tracemalloc.start()
+        start = time.time()
+        try:
+            answer = run(nums)
+        finally:
+            elapsed = time.time() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        results[name] = (answer, elapsed, peak)
+
+    copies = {"slicing": copied[0] - size, "indexed": size + 1}
+    for name, (answer, elapsed, peak) in results.items():
+        print(f"{name:>8}: {elapsed:.4f}s, copied {copies[name]:>8} elements, "
+              f"peak {peak / 1024:.1f} KiB, {len(answer)} tuples")
+
+    assert results["slicing"][0] == results["indexed"][0]
+    slow, fast = results["slicing"][1], results["indexed"][1]
+    print(f"Speedup: {slow / max(fast, 1e-9):.1f}x")
+    return results
+
+if __name__ == "__main__":
+    print("\n--- Benchmark: n_sum slicing vs indexed ---")
+    benchmark_n_sum()
 """
 1. Loop Count Formula:
 
@@ -554,6 +617,165 @@ Your template works for 2-Sum through 5-Sum! ✅
 
 """
 
+# N-Sum with Meet-in-the-Middle (pair-sum index)
+
+# Idea: 4-Sum = pair + pair → precompute every pair sum ONCE
+# pairs[s] = [(x, y), ...] value pairs with x + y = s
+# Query: for each pair sum s, look up pairs[target - s]
+# Disjointness: a value is used at most as often as it appears
+# Repeated queries (different targets) reuse the same index
+
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+
+class PairSumIndex:
+    """
+    Hashed pair-sum index for repeated 2/3/4/5-Sum queries
+
+    Build: O(d²) for d distinct values (once)
+    Query: joins pair lists instead of running nested loops
+    """
+    def __init__(self, nums, max_k=5):
+        # A value never needs more than max_k copies in one answer
+        self.max_k = max_k
+        self.counts = {}
+        for num in nums:
+            self.counts[num] = min(self.counts.get(num, 0) + 1, max_k)
+        self.values = sorted(self.counts)
+
+        # pairs[s] = [(x, y), ...] with x <= y, ordered by x
+        # (x == y only when the value appears at least twice)
+        self.pairs = defaultdict(list)
+        for i, x in enumerate(self.values):
+            if self.counts[x] >= 2:
+                self.pairs[x + x].append((x, x))
+            for y in self.values[i + 1:]:
+                self.pairs[x + y].append((x, y))
+        self.pairs = dict(self.pairs)
+        self.firsts = {s: [x for x, _ in lst] for s, lst in self.pairs.items()}
+
+        self.cache = {}  # (target, k) → answer
+
+    def fits(self, combo):
+        """Index-disjointness: each value used at most as often as it appears"""
+        used = {}
+        for num in combo:
+            used[num] = used.get(num, 0) + 1
+            if used[num] > self.counts[num]:
+                return False
+        return True
+
+    def pairs_from(self, s, low):
+        """Yield value pairs (x, y) with sum s and x >= low"""
+        lst = self.pairs.get(s)
+        if not lst:
+            return
+        for pos in range(bisect_left(self.firsts[s], low), len(lst)):
+            yield lst[pos]
+
+    def k_sum(self, target, k):
+        """All unique k-tuples (sorted lists) that sum to target"""
+        if k < 2 or k > self.max_k:
+            return None
+
+        key = (target, k)
+        if key not in self.cache:
+            found = set()
+            self.join(float('-inf'), target, k, (), found)
+            self.cache[key] = [list(t) for t in sorted(found)]
+        return [t.copy() for t in self.cache[key]]
+
+    def join(self, low, remaining, k, picked, found):
+        """Pick k values >= low (non-decreasing) summing to remaining"""
+        # 2 left: one hash lookup
+        if k == 2:
+            for x, y in self.pairs_from(remaining, low):
+                if self.fits(picked + (x, y)):
+                    found.add(picked + (x, y))
+            return
+
+        # 4 left: pair (x, y) + pair (z, w) with x <= y <= z <= w
+        if k == 4:
+            for s in self.pairs:
+                # sorted → x + y <= z + w, so each split is seen once
+                if s > remaining - s or (remaining - s) not in self.pairs:
+                    continue
+                for x, y in self.pairs_from(s, low):
+                    for z, w in self.pairs_from(remaining - s, y):
+                        combo = picked + (x, y, z, w)
+                        if self.fits(combo):
+                            found.add(combo)
+            return
+
+        # 3 or 5+ left: fix the smallest value, join the rest after it
+        for v in self.values[bisect_left(self.values, low):]:
+            self.join(v, remaining - v, k - 1, picked + (v,), found)
+
+    def four_sum(self, target):
+        return self.k_sum(target, 4)
+
+    def five_sum(self, target):
+        return self.k_sum(target, 5)
+
+
+@lru_cache(maxsize=8)
+def get_pair_sum_index(nums_key):
+    """Cached PairSumIndex per array (key = tuple of the array)"""
+    return PairSumIndex(nums_key)
+
+
+def four_sum_mitm(nums, target):
+    """4-Sum via cached pair-sum index (nums is NOT modified)"""
+    return get_pair_sum_index(tuple(nums)).four_sum(target)
+
+
+def five_sum_mitm(nums, target):
+    """5-Sum via cached pair-sum index (nums is NOT modified)"""
+    return get_pair_sum_index(tuple(nums)).five_sum(target)
+
+nums = [2, 3, 5, 1, -5, -2, 0]
+print(four_sum_mitm(nums, 4))   # same as four_sum
+print(four_sum_mitm(nums, 0))   # index reused, only the join runs
+print(five_sum_mitm([1, 2, 3, 4, 5], 15))  # [[1, 2, 3, 4, 5]]
+
+# Batch workload: one array, many targets
+
+def benchmark_pair_sum_index(size=150, targets=20, value_range=10_000, seed=11):
+    """Many targets on one array: nested-loop four_sum vs cached index"""
+    rng = random.Random(seed)
+    data = [rng.randint(-value_range, value_range) for _ in range(size)]
+    queries = [rng.randint(-value_range, value_range) for _ in range(targets)]
+
+    start = time.time()
+    expected = [four_sum(data.copy(), t) for t in queries]
+    loop_time = time.time() - start
+
+    get_pair_sum_index.cache_clear()
+    start = time.time()
+    got = [four_sum_mitm(data, t) for t in queries]
+    index_time = time.time() - start
+
+    assert got == expected
+    print(f"four_sum (loops): {loop_time:.4f}s for {targets} targets")
+    print(f"pair-sum index:   {index_time:.4f}s (build included)")
+    print(f"Speedup: {loop_time / max(index_time, 1e-9):.1f}x")
+
+if __name__ == "__main__":
+    print("\n--- Benchmark: four_sum loops vs pair-sum index ---")
+    benchmark_pair_sum_index()
+
+"""
+Meet-in-the-middle Key Points:
+✅ Pair sums are built once → O(d²) memory (d = distinct values)
+✅ Value counts keep picks disjoint (no index used twice)
+✅ Sorted split x <= y <= z <= w → check only s <= target - s
+✅ Copies capped at k per value keeps the index small
+✅ set of value tuples removes duplicate answers
+✅ Wins on many targets over spread-out values; for one query on a
+   tiny value range the plain four_sum loops are often just as fast
+"""
+
 # 3️⃣ SLIDING WINDOW (FIXED)
 
 #Maximum Sum of Subarray Size K
@@ -666,6 +888,209 @@ def fixed_sliding_window(arr, k):
 """
 
 
+# Streaming Sliding Window (any iterator, O(k) memory)
+
+# Lists/strings must fit in RAM; files, sockets and generators may not
+# Ring buffer of size k: slot = count % k holds the element that
+# leaves the window when the next one arrives
+# Aggregation is pluggable: add(x), remove(x), result()
+
+from collections import deque
+
+class WindowSum:
+    """Running sum: O(1) add/remove"""
+    def __init__(self):
+        self.total = 0
+
+    def add(self, value):
+        self.total += value
+
+    def remove(self, value):
+        self.total -= value
+
+    def result(self):
+        return self.total
+
+
+class WindowDistinct:
+    """Count of distinct values (frequency dict, like count_good_substrings)"""
+    def __init__(self):
+        self.freq = {}
+
+    def add(self, value):
+        self.freq[value] = self.freq.get(value, 0) + 1
+
+    def remove(self, value):
+        self.freq[value] -= 1
+        if self.freq[value] == 0:
+            self.freq.pop(value)
+
+    def result(self):
+        return len(self.freq)
+
+
+class WindowMin:
+    """
+    Monotonic deque: values kept increasing, front = window minimum
+    Each value is pushed and popped at most once → O(1) amortized
+    """
+    def __init__(self):
+        self.candidates = deque()
+
+    def better(self, a, b):
+        return a < b
+
+    def add(self, value):
+        # Drop values that can never be the answer again
+        while self.candidates and self.better(value, self.candidates[-1]):
+            self.candidates.pop()
+        self.candidates.append(value)
+
+    def remove(self, value):
+        # Only the front can be the leaving element (if it survived)
+        if self.candidates and self.candidates[0] == value:
+            self.candidates.popleft()
+
+    def result(self):
+        return self.candidates[0]
+
+
+class WindowMax(WindowMin):
+    """Same as WindowMin, front = window maximum"""
+    def better(self, a, b):
+        return a > b
+
+
+AGGREGATES = {
+    "sum": WindowSum,
+    "distinct": WindowDistinct,
+    "min": WindowMin,
+    "max": WindowMax,
+}
+
+def stream_windows(iterable, k, aggregate="sum"):
+    """
+    Lazily yield the aggregate of every full window of size k
+
+    Args:
+        iterable: list, string, file, socket reader, generator...
+        k: window size
+        aggregate: "sum" / "distinct" / "min" / "max" or a class
+                   with add(x), remove(x), result()
+
+    Time: O(n) for sum/distinct/min/max, Space: O(k)
+    """
+    if k <= 0:
+        raise ValueError("window size k must be positive")
+    if isinstance(aggregate, str):
+        aggregate = AGGREGATES[aggregate]
+    agg = aggregate()
+    ring = [None] * k
+
+    for count, value in enumerate(iterable):
+        slot = count % k
+        # Window too big? Remove the element leaving on the left
+        if count >= k:
+            agg.remove(ring[slot])
+        ring[slot] = value
+        agg.add(value)
+
+        # Window exact size? Emit
+        if count >= k - 1:
+            yield agg.result()
+
+
+def max_sum_k_stream(iterable, k):
+    """max_sum_k over any iterator (same result as max_sum_k)"""
+    max_sum = 0
+    for window_sum in stream_windows(iterable, k, "sum"):
+        max_sum = max(max_sum, window_sum)
+    return max_sum
+
+
+def count_good_substrings_stream(chars, k):
+    """
+    Count windows of size k with k unique characters (streaming)
+    Only the count: keeping every substring would not be O(k) memory
+    """
+    return sum(1 for distinct in stream_windows(chars, k, "distinct")
+               if distinct == k)
+
+# Test
+print(max_sum_k_stream(iter([2, 1, 5, 1, 3, 2]), 3))        # 9
+print(count_good_substrings_stream(iter("xyzzaz"), 3))       # 1
+print(list(stream_windows([4, 2, 12, 3, 8, 1], 3, "min")))   # [2, 2, 3, 1]
+print(list(stream_windows([4, 2, 12, 3, 8, 1], 3, "max")))   # [12, 12, 12, 8]
+
+# Log stream: one number per line, never loaded fully
+import io
+log_file = io.StringIO("5\n1\n3\n9\n2\n7\n")
+latencies = (int(line) for line in log_file)
+print(list(stream_windows(latencies, 2, "sum")))            # [6, 4, 12, 11, 9]
+
+
+# Sliding Window Maximum / Minimum (Monotonic Deque)
+
+# Naive: max(arr[i:i+k]) for every window → O(n·k) + a copy per window
+# WindowMax / WindowMin above already keep a monotonic deque:
+#   new value arrives → pop beaten values from the back (never useful)
+#   leaving value is the front → pop from the front
+#   front value = window maximum (minimum)
+# Each element pushed/popped once → O(n) total, O(k) memory
+# stream_windows(..., "max") is the one implementation; lists are iterables too
+
+def sliding_window_max(arr, k):
+    """Maximum of every window of size k (LC 239)"""
+    return list(stream_windows(arr, k, "max"))
+
+
+def sliding_window_min(arr, k):
+    """Minimum of every window of size k"""
+    return list(stream_windows(arr, k, "min"))
+
+print(sliding_window_max([1, 3, -1, -3, 5, 3, 6, 7], 3))
+# [3, 3, 5, 5, 6, 7]
+print(sliding_window_min([1, 3, -1, -3, 5, 3, 6, 7], 3))
+# [-1, -3, -3, -3, 3, 3]
+print(list(stream_windows(iter([4, 2, 12, 3]), 2, "max")))  # streaming: [4, 12, 12]
+
+# Benchmark: naive rescan vs monotonic deque
+
+def benchmark_sliding_window_max(n=200_000, ks=(10, 1000, 100_000),
+                                 sample=100, seed=13):
+    """
+    Naive max(arr[i:i+k]) vs sliding_window_max for several k
+
+    Naive is O(n·k): it is timed on the first `sample` windows and
+    scaled to all windows (marked est.) so large k stays runnable
+    """
+    rng = random.Random(seed)
+    data = [rng.randint(0, 10**6) for _ in range(n)]
+
+    for k in ks:
+        windows = n - k + 1
+        if windows <= 0:
+            continue
+
+        start = time.time()
+        fast = sliding_window_max(data, k)
+        deque_time = time.time() - start
+
+        checked = min(sample, windows)
+        start = time.time()
+        naive = [max(data[i:i + k]) for i in range(checked)]
+        naive_time = (time.time() - start) * windows / checked
+
+        assert naive == fast[:checked]
+        print(f"k={k:>6}: naive {naive_time:9.4f}s (est.), "
+              f"deque {deque_time:.4f}s, "
+              f"speedup {naive_time / max(deque_time, 1e-9):.0f}x")
+
+if __name__ == "__main__":
+    print("\n--- Benchmark: naive rescan vs monotonic deque ---")
+    benchmark_sliding_window_max()
+
+
 # 4️⃣ SLIDING WINDOW (VARIABLE)
 
 ## **Problems:**
@@ -761,12 +1186,117 @@ def smallest_subarray_sum(arr, S):
 print(smallest_subarray_sum([2, 1, 5, 2, 3, 2], 7))  # 2
 print(smallest_subarray_sum([2, 1, 5, 2, 8], 7))     # 1
 
+# Longest Substring Without Repeating - byte table fast path
+
+# Sliding window with a set removes chars one by one and hashes each
+# For bytes / ASCII the alphabet has only 256 symbols:
+#   last_seen = array('l', [-1] * 256) → last index of each byte
+#   repeat inside window? jump left straight past it (no while loop)
+# Non-ASCII str → same jump logic with a dict (any alphabet)
+
+from array import array
+
+def longest_substring_no_repeat_fast(s):
+    """
+    Same answer as longest_substring_no_repeat
+
+    bytes / bytearray / memoryview / ASCII str → 256-slot array table
+    other str → dict of last-seen positions
+    Time: O(n), Space: O(1) for bytes (fixed table)
+    """
+    if isinstance(s, str):
+        if not s.isascii():
+            return longest_substring_last_seen_dict(s)
+        s = s.encode("ascii")
+    data = memoryview(s)
+    if data.itemsize != 1:
+        raise TypeError("expected a byte buffer (itemsize 1)")
+    data = data.cast("B")
+
+    last_seen = array('l', [-1]) * 256
+    left = 0
+    max_length = 0
+    for right, byte in enumerate(data):
+        # Seen inside the current window? Jump past it
+        if last_seen[byte] >= left:
+            left = last_seen[byte] + 1
+        last_seen[byte] = right
+        if right - left + 1 > max_length:
+            max_length = right - left + 1
+    return max_length
+
+
+def longest_substring_last_seen_dict(s):
+    """Fallback for large alphabets: last-seen dict + jump"""
+    last_seen = {}
+    left = 0
+    max_length = 0
+    for right, char in enumerate(s):
+        if last_seen.get(char, -1) >= left:
+            left = last_seen[char] + 1
+        last_seen[char] = right
+        max_length = max(max_length, right - left + 1)
+    return max_length
+
+print(longest_substring_no_repeat_fast(b"abcabcbb"))  # 3
+print(longest_substring_no_repeat_fast("pwwkew"))     # 3 (ASCII → table)
+print(longest_substring_no_repeat_fast("häuschen"))   # 7 (dict fallback)
+
+# Benchmark: log lines, set version vs byte table
+
+def benchmark_longest_substring(total_bytes=1_000_000, seed=23):
+    """
+    Longest no-repeat run per log line: str + set vs bytes + table
+    Full-size run: benchmark_longest_substring(100_000_000)
+    """
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789 :/-.[]"
+    lines, size = [], 0
+    while size < total_bytes:
+        line = "".join(rng.choice(alphabet) for _ in range(rng.randint(60, 200)))
+        lines.append(line)
+        size += len(line) + 1
+    byte_lines = [line.encode("ascii") for line in lines]
+
+    start = time.time()
+    slow = [longest_substring_no_repeat(line) for line in lines]
+    set_time = time.time() - start
+
+    start = time.time()
+    fast = [longest_substring_no_repeat_fast(line) for line in byte_lines]
+    table_time = time.time() - start
+
+    assert slow == fast
+    print(f"{len(lines)} lines, {size / 1e6:.1f} MB")
+    print(f"set + str:     {set_time:.4f}s")
+    print(f"table + bytes: {table_time:.4f}s")
+    print(f"Speedup: {set_time / max(table_time, 1e-9):.1f}x")
+
+if __name__ == "__main__":
+    print("\n--- Benchmark: longest substring set vs byte table ---")
+    benchmark_longest_substring()
+
 # 4️⃣ PREFIX SUM
 
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # pure-Python fallback below
+
 # Build Prefix Sum & Range Query
 
-def build_prefix_sum(arr):
-    """Build prefix sum array"""
+def build_prefix_sum(arr, use_numpy=False, dtype=None):
+    """
+    Build prefix sum array
+
+    use_numpy=True → np.cumsum with an explicit dtype:
+        ints default to int64, floats to float64
+        if n * max|x| could overflow int64 → exact Python ints (object)
+        an explicit dtype that could overflow raises OverflowError
+    """
+    if use_numpy:
+        return build_prefix_sum_np(arr, dtype)
+
     n = len(arr)
     prefix = [0] * n
     prefix[0] = arr[0]
@@ -779,12 +1309,56 @@ def build_prefix_sum(arr):
 
 def range_sum(prefix, left, right):
     """Get sum from left to right"""
+    if hasattr(prefix, "range_sum"):
+        return prefix.range_sum(left, right)  # SegmentTree (mutable)
     if left == 0:
         return prefix[right]
     else:
         return prefix[right] - prefix[left - 1]
 
 
+def build_prefix_sum_np(arr, dtype=None):
+    """NumPy prefix sum (same layout: prefix[i] = arr[0] + ... + arr[i])"""
+    if np is None:
+        raise ImportError("NumPy is required for use_numpy=True")
+
+    values = np.asarray(arr)
+    explicit = dtype is not None
+    if dtype is None:
+        dtype = np.float64 if values.dtype.kind in "fc" else np.int64
+    dtype = np.dtype(dtype)
+
+    # Worst case |prefix[i]| <= n * max|x| (computed with Python ints)
+    if dtype.kind in "iu" and len(values):
+        largest = max(abs(int(values.max())), abs(int(values.min())))
+        info = np.iinfo(dtype)
+        if len(values) * largest > info.max or (dtype.kind == "u" and values.min() < 0):
+            if explicit:
+                raise OverflowError(f"prefix sums may not fit in {dtype}")
+            dtype = np.dtype(object)  # exact, but slower
+
+    return np.cumsum(values, dtype=dtype)
+
+
+def range_sum_batch(prefix, lefts, rights):
+    """
+    Sums of many intervals [lefts[i], rights[i]] in ONE vectorized step
+
+    sums = prefix[rights] - prefix[lefts - 1]   (0 when left == 0)
+    Pass a NumPy prefix (use_numpy=True) to skip the list → array copy
+    """
+    if np is None:
+        return [range_sum(prefix, left, right) for left, right in zip(lefts, rights)]
+
+    prefix = np.asarray(prefix)
+    lefts = np.asarray(lefts, dtype=np.intp)
+    rights = np.asarray(rights, dtype=np.intp)
+
+    # lefts - 1 = -1 wraps to the last element; np.where masks it to 0
+    before = np.where(lefts > 0, prefix[lefts - 1], 0)
+    return prefix[rights] - before
+
+
 # Test
 arr = [3, 1, 4, 2, 5]
 print(f"Array: {arr}")
@@ -792,11 +1366,323 @@ print(f"Array: {arr}")
 prefix = build_prefix_sum(arr)
 print(f"Prefix: {prefix}")
 
-print(f"\nQueries:")
+print("\nQueries:")
 print(f"Sum[0:3] = {range_sum(prefix, 0, 3)}")  # 10
 print(f"Sum[1:3] = {range_sum(prefix, 1, 3)}")  # 7
 print(f"Sum[2:4] = {range_sum(prefix, 2, 4)}")  # 11
 
+if np is not None:
+    np_prefix = build_prefix_sum(arr, use_numpy=True)
+    print(f"NumPy prefix: {np_prefix.tolist()}")
+    sums = range_sum_batch(np_prefix, np.array([0, 1, 2]), np.array([3, 3, 4]))
+    print(f"Batch sums: {sums.tolist()}")  # [10, 7, 11]
+
+    # Overflow handling: int64 can't hold this → exact Python ints
+    big = build_prefix_sum([2**62, 2**62, 2**62], use_numpy=True)
+    print(f"Big prefix dtype: {big.dtype}, last = {big[-1]}")
+
+# Speed check: one range_sum call per interval vs one batch call
+def benchmark_range_sum_batch(n=1_000_000, queries=1_000_000, seed=9):
+    """Per-call range_sum loop vs range_sum_batch (analytics: ~10M queries)"""
+    if np is None:
+        print("NumPy not installed - skipping batch benchmark")
+        return
+
+    rng = np.random.default_rng(seed)
+    data = rng.integers(-1000, 1000, size=n)
+    lefts = rng.integers(0, n, size=queries)
+    rights = np.minimum(lefts + rng.integers(0, 1000, size=queries), n - 1)
+
+    prefix_list = build_prefix_sum(data.tolist())
+    left_list, right_list = lefts.tolist(), rights.tolist()
+    start = time.time()
+    loop_sums = [range_sum(prefix_list, l, r) for l, r in zip(left_list, right_list)]
+    loop_time = time.time() - start
+
+    prefix_np = build_prefix_sum(data, use_numpy=True)
+    start = time.time()
+    batch_sums = range_sum_batch(prefix_np, lefts, rights)
+    batch_time = time.time() - start
+
+    assert loop_sums == batch_sums.tolist()
+    print(f"range_sum loop:  {loop_time:.4f}s for {queries} queries")
+    print(f"range_sum_batch: {batch_time:.4f}s")
+    print(f"Speedup: {loop_time / max(batch_time, 1e-9):.1f}x")
+
+if __name__ == "__main__":
+    print("\n--- Benchmark: range_sum loop vs batch ---")
+    benchmark_range_sum_batch(n=200_000, queries=200_000)
+
+# Segment Tree: Range Query + Point Update (mutable prefix sum)
+
+# Prefix sum: query O(1), but one update = O(n) rebuild
+# Segment tree: query O(log n), update O(log n)
+# Works for any monoid (associative combine + identity): sum, min, max
+
+import operator
+
+SUM = (operator.add, 0)
+MIN = (min, float('inf'))
+MAX = (max, float('-inf'))
+
+class SegmentTree:
+    """
+    Array-backed segment tree (iterative, no node objects)
+
+    tree[1] is the root, children of i are 2i and 2i+1,
+    leaves (the original values) live at tree[n:]
+
+    build: O(n), update: O(log n), query: O(log n)
+    Drop-in for prefix/range_sum: range_sum(tree, left, right)
+    """
+    def __init__(self, values=(), monoid=SUM):
+        self.combine, self.identity = monoid
+        self.build(values)
+
+    def build(self, values):
+        """Bulk-load from a list or NumPy array in O(n)"""
+        if hasattr(values, "tolist"):
+            values = values.tolist()  # NumPy → Python numbers (faster math)
+        n = len(values)
+        tree = [self.identity] * n + list(values)
+        combine = self.combine
+
+        # Fill parents bottom-up
+        for i in range(n - 1, 0, -1):
+            tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+
+        self.n = n
+        self.tree = tree
+        return self
+
+    def update(self, index, value):
+        """Set arr[index] = value and fix every parent up to the root"""
+        if not 0 <= index < self.n:
+            raise IndexError("index out of range")
+        tree = self.tree
+        combine = self.combine
+
+        i = index + self.n
+        tree[i] = value
+        i //= 2
+        while i >= 1:
+            tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+            i //= 2
+
+    def query(self, left, right):
+        """Aggregate of arr[left..right] (inclusive, like range_sum)"""
+        if not 0 <= left <= right < self.n:
+            raise IndexError("range out of bounds")
+        tree = self.tree
+        combine = self.combine
+
+        # Left and right results kept apart → order is preserved
+        res_left = res_right = self.identity
+        lo = left + self.n
+        hi = right + self.n + 1
+        while lo < hi:
+            if lo & 1:
+                res_left = combine(res_left, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                res_right = combine(tree[hi], res_right)
+            lo //= 2
+            hi //= 2
+        return combine(res_left, res_right)
+
+    def range_sum(self, left, right):
+        """Same name/meaning as range_sum(prefix, left, right)"""
+        return self.query(left, right)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        return self.tree[index + self.n]
+
+# Test
+arr = [3, 1, 4, 2, 5]
+tree = SegmentTree(arr)
+print(f"Sum[1:3] = {range_sum(tree, 1, 3)}")  # 7 (same call as prefix)
+tree.update(2, 10)                             # arr[2] = 10, O(log n)
+print(f"Sum[1:3] = {range_sum(tree, 1, 3)}")  # 13
+
+min_tree = SegmentTree(arr, MIN)
+max_tree = SegmentTree(arr, MAX)
+print(f"Min[1:4] = {min_tree.query(1, 4)}")   # 1
+print(f"Max[0:2] = {max_tree.query(0, 2)}")   # 4
+
+# Benchmark: prefix rebuild vs segment tree (updates + queries mixed)
+
+def benchmark_segment_tree(n=100_000, ops=100, update_ratio=0.5, seed=3):
+    """
+    Mixed point updates and range queries
+
+    Prefix approach: update → rebuild prefix in O(n)
+    Segment tree:    update → O(log n)
+    Full-size run: benchmark_segment_tree(n=1_000_000)
+    """
+    rng = random.Random(seed)
+    data = [rng.randint(-1000, 1000) for _ in range(n)]
+    script = []
+    for _ in range(ops):
+        if rng.random() < update_ratio:
+            script.append(("update", rng.randrange(n), rng.randint(-1000, 1000)))
+        else:
+            left = rng.randrange(n)
+            script.append(("query", left, rng.randrange(left, n)))
+
+    # Prefix sum + rebuild on every update
+    start = time.time()
+    values = data.copy()
+    prefix = build_prefix_sum(values)
+    prefix_answers = []
+    for op, a, b in script:
+        if op == "update":
+            values[a] = b
+            prefix = build_prefix_sum(values)
+        else:
+            prefix_answers.append(range_sum(prefix, a, b))
+    prefix_time = time.time() - start
+
+    # Segment tree (build included)
+    start = time.time()
+    tree = SegmentTree(data)
+    tree_answers = []
+    for op, a, b in script:
+        if op == "update":
+            tree.update(a, b)
+        else:
+            tree_answers.append(range_sum(tree, a, b))
+    tree_time = time.time() - start
+
+    assert prefix_answers == tree_answers
+    print(f"n={n}, ops={ops}")
+    print(f"Prefix + rebuild: {prefix_time:.4f}s")
+    print(f"Segment tree:     {tree_time:.4f}s")
+    print(f"Speedup: {prefix_time / max(tree_time, 1e-9):.1f}x")
+
+if __name__ == "__main__":
+    print("\n--- Benchmark: prefix rebuild vs segment tree ---")
+    benchmark_segment_tree()
+
+# Sparse Table: O(1) Range Min / Max (static data)
+
+# table[j][i] = min(arr[i : i + 2^j])
+# Any range [l, r] is covered by TWO overlapping power-of-2 blocks:
+#   j = floor(log2(r - l + 1))
+#   min(l..r) = min(table[j][l], table[j][r - 2^j + 1])
+# Overlap is fine because min/max are idempotent (min(x, x) = x)
+# NOT for sums → use prefix sums or SegmentTree for those
+
+class SparseTable:
+    """
+    Sparse table for idempotent range queries (min / max)
+
+    build: O(n log n), query: O(1), query_batch: one vectorized call
+    Storage: one 2-D NumPy array, or one array('q'/'d') per level
+    """
+    def __init__(self, values, op="min"):
+        if op not in ("min", "max"):
+            raise ValueError("op must be 'min' or 'max'")
+        self.op = min if op == "min" else max
+        self.n = n = len(values)
+        self.levels = max(n.bit_length(), 1)
+
+        # log_table[length] = floor(log2(length))
+        self.log_table = [0] * (n + 1)
+        for length in range(2, n + 1):
+            self.log_table[length] = self.log_table[length // 2] + 1
+
+        if np is not None:
+            self.np_op = np.minimum if op == "min" else np.maximum
+            base = np.asarray(values)
+            table = np.empty((self.levels, n), dtype=base.dtype)
+            table[0] = base
+            for j in range(1, self.levels):
+                half = 1 << (j - 1)
+                width = n - (1 << j) + 1
+                table[j] = table[j - 1]  # tail cells are never read
+                table[j, :width] = self.np_op(table[j - 1, :width],
+                                              table[j - 1, half:half + width])
+            self.table = table
+            self.np_log = np.array(self.log_table, dtype=np.int64)
+        else:
+            self.table = [self.to_array(values)]
+            for j in range(1, self.levels):
+                prev = self.table[j - 1]
+                half = 1 << (j - 1)
+                width = n - (1 << j) + 1
+                level = self.to_array(self.op(prev[i], prev[i + half])
+                                      for i in range(width))
+                self.table.append(level)
+
+    @staticmethod
+    def to_array(values):
+        """Compact typed storage: int64, then float64, else plain list"""
+        values = list(values)
+        for typecode in ("q", "d"):
+            try:
+                return array(typecode, values)
+            except (TypeError, OverflowError):
+                continue
+        return values
+
+    def query(self, left, right):
+        """min/max of arr[left..right] (inclusive) in O(1)"""
+        if not 0 <= left <= right < self.n:
+            raise IndexError("range out of bounds")
+        j = self.log_table[right - left + 1]
+        row = self.table[j]
+        return self.op(row[left], row[right - (1 << j) + 1])
+
+    def query_batch(self, pairs):
+        """Answer many (l, r) pairs at once (NumPy: fancy indexing, no loop)"""
+        if np is None:
+            return [self.query(left, right) for left, right in pairs]
+
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        lefts, rights = pairs[:, 0], pairs[:, 1]
+        if len(pairs) and (lefts.min() < 0 or rights.max() >= self.n
+                           or (lefts > rights).any()):
+            raise IndexError("range out of bounds")
+        j = self.np_log[rights - lefts + 1]
+        return self.np_op(self.table[j, lefts],
+                          self.table[j, rights - (1 << j) + 1])
+
+# Test
+arr = [5, 2, 8, 1, 9, 3, 7]
+min_table = SparseTable(arr, "min")
+max_table = SparseTable(arr, "max")
+print(f"Min[1:4] = {min_table.query(1, 4)}")  # 1
+print(f"Max[0:2] = {max_table.query(0, 2)}")  # 8
+print(f"Batch min: {[int(x) for x in min_table.query_batch([(0, 6), (4, 6), (2, 2)])]}")
+# [1, 3, 8]
+
+# Speed check: slice rescan vs sparse table batch
+if __name__ == "__main__":
+    rng = random.Random(5)
+    data = [rng.randint(0, 10**6) for _ in range(100_000)]
+    queries = []
+    for _ in range(20_000):
+        left = rng.randrange(len(data))
+        queries.append((left, min(len(data) - 1, left + rng.randrange(1000))))
+
+    start = time.time()
+    slow = [min(data[left:right + 1]) for left, right in queries]
+    slice_time = time.time() - start
+
+    start = time.time()
+    table = SparseTable(data, "min")
+    fast = table.query_batch(queries)
+    table_time = time.time() - start
+
+    assert slow == list(fast)
+    print(f"\nmin(arr[l:r+1]) x {len(queries)}: {slice_time:.4f}s")
+    print(f"SparseTable build + batch:  {table_time:.4f}s")
+
+
 # Subarray Sum Equals K
 
 
@@ -892,26 +1778,33 @@ print(kadanes([-1, -2, -3, -4]))                  # -1
 
 # Kadane's with Indices
 
-def kadanes_with_indices(arr):
-    """Find max sum subarray and return subarray itself"""
+def kadanes_span(arr):
+    """Serial Kadane returning (max_sum, start, end) - indices only"""
     max_sum = float('-inf')
     current_sum = 0
     start = 0
     end = 0
     temp_start = 0
-    
+
     for i in range(len(arr)):
         current_sum += arr[i]
-        
+
         if current_sum > max_sum:
             max_sum = current_sum
             start = temp_start
             end = i
-        
+
         if current_sum < 0:
             current_sum = 0
             temp_start = i + 1
-    
+
+    return max_sum, start, end
+
+print(kadanes_span([-2, 1, -3, 4, -1, 2, 1, -5, 4]))  # (6, 3, 6)
+
+def kadanes_with_indices(arr):
+    """Find max sum subarray and return subarray itself"""
+    max_sum, start, end = kadanes_span(arr)
     return arr[start:end+1], max_sum
 
 arr = [-2, 1, -3, 4, -1, 2, 1, -5, 4]
@@ -919,6 +1812,192 @@ subarray, sum_val = kadanes_with_indices(arr)
 print(f"Subarray: {subarray}, Sum: {sum_val}")
 # Subarray: [4, -1, 2, 1], Sum: 6
 
+# Parallel Kadane (chunks in a process pool, exact same indices)
+
+# Kadane in prefix-sum form (P[i] = arr[0] + ... + arr[i]):
+#   current_sum at i = P[i] - m,  m = lowest prefix seen so far (start 0)
+#   reset (current_sum < 0)  ⇔  P[i] < m  → m = P[i], temp_start = i + 1
+# So the serial state entering a chunk is just (offset, m, m_index):
+#   Pass 1 (parallel): per chunk → total, lowest local prefix (+ index)
+#   Combine (serial, #chunks steps): offset and (m, m_index) per chunk
+#   Pass 2 (parallel): per chunk → best current_sum, its end and start
+#   Winner: largest best, earliest chunk on ties (serial uses strict >)
+# Data is shared, never pickled: SharedMemory block or np.memmap file
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+def memmap_source(arr):
+    """
+    (path, byte offset) to reopen a contiguous np.memmap - or a slice of
+    one - in a worker; None if it can't be reopened
+
+    A slice keeps its parent's .offset, so the real start is found from
+    the distance to the memmap that owns the mapping
+    """
+    if not isinstance(arr, np.memmap) or not arr.filename or not arr.flags.c_contiguous:
+        return None
+    root = arr
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if not isinstance(root, np.memmap):
+        return None
+    return arr.filename, root.offset + (arr.ctypes.data - root.ctypes.data)
+
+
+def kadane_sum_dtype(dtype):
+    """Accumulator for cumsum: int64 for ints/bools, float64 for floats, else None"""
+    if np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.bool_):
+        return np.int64
+    if np.issubdtype(dtype, np.floating):
+        return np.float64
+    return None
+
+
+def open_shared(source, n):
+    """Attach to the shared array in a worker → (array, handle to close)"""
+    if source[0] == "file":
+        _, filename, offset, dtype = source
+        return np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=(n,)), None
+    _, name, dtype = source
+    shm = shared_memory.SharedMemory(name=name)
+    return np.ndarray((n,), dtype=dtype, buffer=shm.buf), shm
+
+
+def kadane_chunk_summary(task):
+    """Pass 1: (total, lowest local prefix, its first index) of one chunk"""
+    source, n, lo, hi = task
+    data, shm = open_shared(source, n)
+    try:
+        local = np.cumsum(data[lo:hi], dtype=kadane_sum_dtype(data.dtype))
+        low_index = int(np.argmin(local))  # argmin → first occurrence
+        return local[-1].item(), local[low_index].item(), lo + low_index
+    finally:
+        del data  # release the view before closing shared memory
+        if shm is not None:
+            shm.close()
+
+
+def kadane_chunk_best(task):
+    """Pass 2: replay serial Kadane on one chunk from the carried state"""
+    source, n, lo, hi, offset, low, low_index = task
+    data, shm = open_shared(source, n)
+    try:
+        prefix = offset + np.cumsum(data[lo:hi], dtype=kadane_sum_dtype(data.dtype))
+
+        # m before each i: running min of [carried m, P[lo], ..., P[i-1]]
+        seen = np.concatenate(([low], prefix))
+        running = np.minimum.accumulate(seen)
+        current = prefix - running[:-1]
+
+        end = int(np.argmax(current))  # first max = serial strict >
+        m_value = running[end]
+        first = int(np.argmax(running == m_value))  # strict < keeps first
+        m_index = low_index if first == 0 else lo + first - 1
+        return current[end].item(), m_index + 1, lo + end
+    finally:
+        del data  # release the view before closing shared memory
+        if shm is not None:
+            shm.close()
+
+
+def kadanes_parallel(arr, workers=None, chunk_size=None):
+    """
+    Max subarray (sum, start, end) over int or float data in a process pool
+
+    Same answer and SAME indices as kadanes_span / kadanes_with_indices
+    (floats: the prefix-sum form rounds differently, so near-ties can
+    differ in the last bits)
+    arr: list, NumPy array, or np.memmap (workers reopen the file, slices
+         included); anything else is copied into shared memory once,
+         in its own dtype
+    Falls back to the serial scan without NumPy, for tiny inputs, or
+    for values that aren't int/float (Fraction, Decimal, ...)
+    """
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    if np is None or n == 0 or n < 2 * workers:
+        return kadanes_span(arr)
+    chunk_size = chunk_size or -(-n // workers)  # ceil division
+
+    shm = None
+    location = memmap_source(arr)
+    if location is not None:
+        if kadane_sum_dtype(arr.dtype) is None:
+            return kadanes_span(arr)
+        source = ("file", *location, arr.dtype.str)
+    else:
+        values = np.asarray(arr)
+        if kadane_sum_dtype(values.dtype) is None:
+            return kadanes_span(arr)
+        shm = shared_memory.SharedMemory(create=True, size=values.nbytes)
+        np.ndarray((n,), dtype=values.dtype, buffer=shm.buf)[:] = values
+        source = ("shm", shm.name, values.dtype.str)
+
+    try:
+        bounds = [(lo, min(lo + chunk_size, n)) for lo in range(0, n, chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = list(pool.map(kadane_chunk_summary,
+                                      [(source, n, lo, hi) for lo, hi in bounds]))
+
+            # Carry serial state (offset, m, m_index) chunk by chunk
+            tasks = []
+            offset, low, low_index = 0, 0, -1
+            for (lo, hi), (total, local_low, local_index) in zip(bounds, summaries):
+                tasks.append((source, n, lo, hi, offset, low, low_index))
+                if offset + local_low < low:
+                    low, low_index = offset + local_low, local_index
+                offset += total
+
+            results = list(pool.map(kadane_chunk_best, tasks))
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    # Earliest chunk wins ties, like the serial strict >
+    best = results[0]
+    for result in results[1:]:
+        if result[0] > best[0]:
+            best = result
+    return best
+
+# kadanes_parallel's workers import this module too: they only rerun the
+# small demos, never this 2M-element comparison or the later speed checks
+if __name__ == "__main__" and np is not None:
+    print("\n--- Benchmark: serial vs parallel Kadane ---")
+    rng = np.random.default_rng(21)
+    big = rng.integers(-1000, 1000, size=2_000_000, dtype=np.int64)
+
+    start = time.time()
+    serial = kadanes_span(big.tolist())
+    serial_time = time.time() - start
+
+    start = time.time()
+    parallel = kadanes_parallel(big)
+    parallel_time = time.time() - start
+
+    assert serial == parallel
+    print(f"Serial:   {serial_time:.4f}s → {serial}")
+    print(f"Parallel: {parallel_time:.4f}s → {parallel}")
+
+    # Slices of an np.memmap are reopened at their own offset
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "values.bin")
+        big[:200_000].tofile(path)
+        disk = np.memmap(path, dtype=np.int64, mode="r")
+        for view in (disk[500:], disk[1234:150_000]):
+            assert kadanes_parallel(view, workers=4) == kadanes_span(view.tolist())
+        del disk, view
+    print("Sliced np.memmap matches kadanes_span ✓")
+
+    # Floats stay floats (list → float64 shared buffer)
+    halves = [0.5] * 10 + [-0.4] * 10
+    assert kadanes_parallel(halves, workers=4) == kadanes_span(halves) == (5.0, 0, 9)
+    print(f"Floats: {kadanes_parallel(halves, workers=4)} ✓")
+
 # 6️⃣ BINARY SEARCH (BASIC)
 
 ## **Problems:**
@@ -1018,6 +2097,90 @@ arr = [1, 2, 2, 2, 3, 4, 5]
 print(first_occurrence(arr, 2))  # 1
 print(last_occurrence(arr, 2))   # 3
 
+# Batch lookups: many targets in one call (sorted ID joins)
+
+# One Python call per target = interpreter overhead per lookup
+# bisect_left(arr, t)      → first index with arr[i] >= t  (first occurrence)
+# bisect_right(arr, t) - 1 → last index with arr[i] <= t   (last occurrence)
+# numpy.searchsorted(arr, targets, side="left"/"right") does ALL targets at once
+# Miss → -1 (same as first_occurrence / last_occurrence)
+
+from bisect import bisect_right
+
+def occurrence_range_batch(arr, targets):
+    """
+    (firsts, lasts, counts) for every target in a sorted array
+
+    firsts/lasts: -1 where the target is missing
+    counts: last - first + 1 (0 on a miss)
+    NumPy: pass arr as a NumPy array to avoid a copy per call
+    """
+    if np is None:
+        firsts, lasts, counts = [], [], []
+        for target in targets:
+            left = bisect_left(arr, target)
+            right = bisect_right(arr, target) - 1
+            found = left <= right
+            firsts.append(left if found else -1)
+            lasts.append(right if found else -1)
+            counts.append(right - left + 1 if found else 0)
+        return firsts, lasts, counts
+
+    arr = np.asarray(arr)
+    targets = np.asarray(targets)
+    left = np.searchsorted(arr, targets, side="left")
+    right = np.searchsorted(arr, targets, side="right") - 1
+
+    # left > right means the target is not present
+    found = left <= right
+    firsts = np.where(found, left, -1)
+    lasts = np.where(found, right, -1)
+    counts = np.where(found, lasts - firsts + 1, 0)
+    return firsts, lasts, counts
+
+
+def first_occurrence_batch(arr, targets):
+    """first_occurrence for many targets"""
+    return occurrence_range_batch(arr, targets)[0]
+
+
+def last_occurrence_batch(arr, targets):
+    """last_occurrence for many targets"""
+    return occurrence_range_batch(arr, targets)[1]
+
+
+def binary_search_batch(arr, targets):
+    """
+    binary_search for many targets (-1 on a miss)
+    With duplicates this returns the FIRST match (binary_search may hit any)
+    """
+    return first_occurrence_batch(arr, targets)
+
+arr = [1, 2, 2, 2, 3, 4, 5]
+firsts, lasts, counts = occurrence_range_batch(arr, [2, 6, 1])
+print([int(i) for i in firsts], [int(i) for i in lasts], [int(c) for c in counts])
+# [1, -1, 0] [3, -1, 0] [3, 0, 1]
+
+# Speed check: sorted ID join (one call per id vs one batch call)
+if __name__ == "__main__" and np is not None:
+    rng = np.random.default_rng(17)
+    ids = np.sort(rng.integers(0, 2_000_000, size=1_000_000))
+    lookups = rng.integers(0, 2_000_000, size=200_000)
+
+    ids_list, lookups_list = ids.tolist(), lookups.tolist()
+    start = time.time()
+    slow = [first_occurrence(ids_list, t) for t in lookups_list]
+    loop_time = time.time() - start
+
+    start = time.time()
+    fast = first_occurrence_batch(ids, lookups)
+    batch_time = time.time() - start
+
+    assert slow == fast.tolist()
+    print(f"first_occurrence loop: {loop_time:.4f}s for {len(lookups_list)} ids")
+    print(f"first_occurrence_batch: {batch_time:.4f}s")
+
+
 # 7️⃣ BINARY SEARCH ON ANSWER
 
 ## **Problems:**
@@ -1105,6 +2268,203 @@ def ship_within_days(weights, days):
 
 print(ship_within_days([1,2,3,4,5,6,7,8,9,10], 5))  # 15
 
+# Faster Binary Search on Answer (many H / days queries, same data)
+
+# 1. Narrow the bounds analytically before bisecting
+#    Koko:  hours(s) >= total / s        → s >= ceil(total / H)
+#           hours(s) <  total / s + n    → s = ceil(total / (H - n)) works
+#           (n = NON-EMPTY piles: a pile of 0 takes 0 hours)
+#    Ship:  cap >= max(w), cap >= ceil(total / days)
+#           every full day carries > cap - max(w)
+#           → cap = max(w) + ceil(total / days) always works
+# 2. Vectorize the feasibility check
+#    Koko:  sum(ceil(p / s)) = sum((p + s - 1) // s) over a NumPy array
+#    Ship:  greedy day = jump on prefix sums with searchsorted
+#           (O(days · log n) per probe instead of O(n))
+# 3. Answer MANY queries in lockstep: one bisect round = one NumPy pass
+
+def eating_speed_bounds(total, largest, n, H):
+    """Smallest/largest speeds worth checking (H >= n non-empty piles)"""
+    low = max(1, -(-total // max(H, 1)))
+    high = largest
+    if H > n:
+        high = min(high, -(-total // (H - n)))
+    return low, high
+
+
+def min_eating_speed_many(piles, hours_list):
+    """
+    min_eating_speed for every H in hours_list (same answers)
+
+    H < number of non-empty piles is impossible → max(piles) + 1,
+    like the original (empty piles cost no hours)
+    """
+    n = sum(1 for pile in piles if pile > 0)
+    total, largest = sum(piles), max(piles)
+
+    if np is None:
+        answers = []
+        for H in hours_list:
+            if H < n:
+                answers.append(largest + 1)
+                continue
+            left, right = eating_speed_bounds(total, largest, n, H)
+            while left < right:
+                mid = (left + right) // 2
+                if sum((pile + mid - 1) // mid for pile in piles) <= H:
+                    right = mid
+                else:
+                    left = mid + 1
+            answers.append(left)
+        return answers
+
+    pile_arr = np.asarray(piles, dtype=np.int64)
+    queries, inverse = np.unique(np.asarray(hours_list, dtype=np.int64),
+                                 return_inverse=True)
+    possible = queries >= n
+
+    hours = np.maximum(queries, 1)
+    low = np.maximum(1, -(-total // hours))
+    high = np.full(len(queries), largest, dtype=np.int64)
+    room = queries - n
+    high = np.where(room > 0, np.minimum(high, -(-total // np.maximum(room, 1))), high)
+    low = np.where(possible, low, high)  # impossible queries skip the bisect
+
+    # Rows per block keep the (queries × piles) matrix around 4M cells
+    block = max(1, 4_000_000 // len(pile_arr))
+    while True:
+        active = np.nonzero(low < high)[0]
+        if len(active) == 0:
+            break
+        mid = (low[active] + high[active]) // 2
+        needed = np.empty(len(active), dtype=np.int64)
+        for at in range(0, len(active), block):
+            speeds = mid[at:at + block, None]
+            needed[at:at + block] = ((pile_arr + speeds - 1) // speeds).sum(axis=1)
+        ok = needed <= queries[active]
+        high[active] = np.where(ok, mid, high[active])
+        low[active] = np.where(ok, low[active], mid + 1)
+
+    answers = np.where(possible, low, largest + 1)
+    return answers[inverse].tolist()
+
+
+def ship_capacity_bounds(total, largest, days):
+    """Smallest/largest capacities worth checking (days >= 1)"""
+    per_day = -(-total // days)
+    return max(largest, per_day), min(total, largest + per_day)
+
+
+def days_needed(prefix, capacity, limit):
+    """Greedy days via jumps on prefix sums (stops once > limit)"""
+    pos, used, n = 0, 0, len(prefix) - 1
+    while pos < n and used <= limit:
+        pos = bisect_right(prefix, prefix[pos] + capacity) - 1
+        used += 1
+    return used
+
+
+def ship_within_days_many(weights, days_list):
+    """
+    ship_within_days for every days value in days_list (same answers)
+
+    days < 1 is impossible → sum(weights) + 1, like the original
+    """
+    total, largest = sum(weights), max(weights)
+    prefix = [0]
+    for weight in weights:
+        prefix.append(prefix[-1] + weight)
+
+    if np is None:
+        answers = []
+        for days in days_list:
+            if days < 1:
+                answers.append(total + 1)
+                continue
+            left, right = ship_capacity_bounds(total, largest, days)
+            while left < right:
+                mid = (left + right) // 2
+                if days_needed(prefix, mid, days) <= days:
+                    right = mid
+                else:
+                    left = mid + 1
+            answers.append(left)
+        return answers
+
+    prefix_arr = np.asarray(prefix, dtype=np.int64)
+    n = len(weights)
+    queries, inverse = np.unique(np.asarray(days_list, dtype=np.int64),
+                                 return_inverse=True)
+    possible = queries >= 1
+
+    per_day = -(-total // np.maximum(queries, 1))
+    low = np.maximum(largest, per_day)
+    high = np.where(possible, np.minimum(total, largest + per_day), low)
+
+    while True:
+        active = np.nonzero(low < high)[0]
+        if len(active) == 0:
+            break
+        caps = (low[active] + high[active]) // 2
+        limits = queries[active]
+
+        # All probes walk their greedy days together
+        pos = np.zeros(len(active), dtype=np.int64)
+        used = np.zeros(len(active), dtype=np.int64)
+        while True:
+            moving = np.nonzero((pos < n) & (used <= limits))[0]
+            if len(moving) == 0:
+                break
+            reach = prefix_arr[pos[moving]] + caps[moving]
+            pos[moving] = np.searchsorted(prefix_arr, reach, side="right") - 1
+            used[moving] += 1
+
+        ok = used <= limits
+        high[active] = np.where(ok, caps, high[active])
+        low[active] = np.where(ok, low[active], caps + 1)
+
+    answers = np.where(possible, low, total + 1)
+    return answers[inverse].tolist()
+
+print(min_eating_speed_many([3, 6, 7, 11], [8, 5, 4, 3]))  # [4, 7, 11, 12]
+print(min_eating_speed_many([22, 26, 18, 0, 17, 12, 0, 30], [7, 5]))  # [26, 31]
+print(ship_within_days_many([1,2,3,4,5,6,7,8,9,10], [5, 1, 10]))  # [15, 55, 10]
+
+# Speed check: capacity planning = many queries on one dataset
+if __name__ == "__main__":
+    rng = random.Random(19)
+    piles = [rng.randint(1, 10**6) for _ in range(2_000)]
+    hour_queries = [rng.randint(2_000, 50_000) for _ in range(200)]
+
+    start = time.time()
+    slow = [min_eating_speed(piles, H) for H in hour_queries]
+    loop_time = time.time() - start
+
+    start = time.time()
+    fast = min_eating_speed_many(piles, hour_queries)
+    many_time = time.time() - start
+
+    assert slow == fast
+    print(f"\nmin_eating_speed x {len(hour_queries)}: {loop_time:.4f}s")
+    print(f"min_eating_speed_many:      {many_time:.4f}s")
+
+    weights = [rng.randint(1, 500) for _ in range(20_000)]
+    day_queries = [rng.randint(1, 200) for _ in range(30)]
+
+    start = time.time()
+    slow = [ship_within_days(weights, d) for d in day_queries]
+    loop_time = time.time() - start
+
+    start = time.time()
+    fast = ship_within_days_many(weights, day_queries)
+    many_time = time.time() - start
+
+    assert slow == fast
+    print(f"ship_within_days x {len(day_queries)}: {loop_time:.4f}s")
+    print(f"ship_within_days_many:      {many_time:.4f}s")
+
+
+
 # 8️⃣ ROTATED SORTED ARRAY
 
 # ## **Problems:**
@@ -1178,6 +2538,95 @@ def find_min(nums):
 print(find_min([3, 4, 5, 1, 2]))     # 1
 print(find_min([4, 5, 6, 7, 0, 1, 2]))  # 0
 
+# Rotated Array Index (find the pivot ONCE, then plain bisects)
+
+# search_rotated / find_min re-derive the rotation on every call
+# Pivot = index of the minimum → array = two sorted halves:
+#   nums[:pivot]  (bigger values)   nums[pivot:]  (smaller values)
+# target >= nums[0] → bisect left half, else bisect right half
+# Ring buffer advances: the oldest (minimum) slot is overwritten with
+# a new largest value → pivot just moves one step (O(1))
+
+class RotatedArrayIndex:
+    """
+    Cached pivot for repeated lookups in a rotated sorted array
+
+    build: O(log n), search: O(log n) bisect, push: O(1)
+    Assumes distinct values while building (like search_rotated)
+    """
+    def __init__(self, nums):
+        self.nums = nums
+        self.np_nums = None  # NumPy copy for search_batch, built lazily
+        self.refresh()
+
+    def refresh(self):
+        """Find the pivot again (after arbitrary changes to nums)"""
+        nums = self.nums
+        left, right = 0, len(nums) - 1
+        while left < right:
+            mid = (left + right) // 2
+            if nums[mid] > nums[right]:
+                left = mid + 1
+            else:
+                right = mid
+        self.pivot = left
+        self.np_nums = None
+
+    def find_min(self):
+        """Same as find_min(nums), O(1)"""
+        return self.nums[self.pivot]
+
+    def search(self, target):
+        """Same as search_rotated(nums, target): index or -1"""
+        nums, pivot = self.nums, self.pivot
+        if not nums:
+            return -1
+        if pivot > 0 and target >= nums[0]:
+            lo, hi = 0, pivot          # left (bigger) half
+        else:
+            lo, hi = pivot, len(nums)  # right (smaller) half
+        i = bisect_left(nums, target, lo, hi)
+        return i if i < hi and nums[i] == target else -1
+
+    def search_batch(self, targets):
+        """search() for many targets (NumPy: two searchsorted calls)"""
+        if np is None or not self.nums:
+            return [self.search(target) for target in targets]
+        if self.np_nums is None:
+            self.np_nums = np.asarray(self.nums)
+
+        arr, pivot, n = self.np_nums, self.pivot, len(self.nums)
+        targets = np.asarray(targets)
+        in_left = (targets >= arr[0]) & (pivot > 0)
+
+        pos = np.where(in_left,
+                       np.searchsorted(arr[:pivot], targets),
+                       pivot + np.searchsorted(arr[pivot:], targets))
+        end = np.where(in_left, pivot, n)
+        found = (pos < end) & (arr[np.minimum(pos, n - 1)] == targets)
+        return np.where(found, pos, -1)
+
+    def push(self, value):
+        """
+        Ring buffer advance: overwrite the oldest (minimum) slot
+        value must be >= the current maximum to keep the array rotated-sorted
+        """
+        nums, pivot = self.nums, self.pivot
+        if value < nums[pivot - 1]:  # pivot - 1 = position of the maximum
+            raise ValueError("pushed value must be >= current maximum")
+        nums[pivot] = value
+        if self.np_nums is not None:
+            self.np_nums[pivot] = value
+        self.pivot = (pivot + 1) % len(nums)
+
+# Test
+ring = RotatedArrayIndex([4, 5, 6, 7, 0, 1, 2])
+print(ring.search(0), ring.search(6), ring.search(3))   # 4 2 -1
+print([int(i) for i in ring.search_batch([0, 6, 3, 2])])  # [4, 2, -1, 6]
+ring.push(8)                                             # 0 → 8
+print(ring.nums, ring.find_min(), ring.search(8))        # [4, 5, 6, 7, 8, 1, 2] 1 4
+
+
 
 # 🔟 PEAK ELEMENT
 
@@ -316,7 +316,8 @@ def contains_nearby_duplicate(nums, k):
     Returns:
         bool: True if duplicate exists within k distance
     
-    Time: O(n), Space: O(min(n, k))
+    Time: O(n), Space: O(n) - `seen` keeps every distinct value
+    (nearby_duplicate_pair below evicts old values: O(k))
     
     Example:
         nums = [1,2,3,1], k = 3 → True (1 appears at index 0 and 3)
@@ -343,6 +344,153 @@ for nums, k in test_cases:
     result = contains_nearby_duplicate(nums, k)
     print(f"{nums}, k={k} → {result}")
 
+# ----------------------------------------------------------------------------
+# Really O(k) memory: evict values that leave the window
+# ----------------------------------------------------------------------------
+"""
+`seen` above keeps EVERY distinct value ever seen → O(n) on a long stream
+Only the last k values can still match, so keep just those:
+
+    ring buffer (size k): value stored at index i lives in slot i % k
+    window dict:          value → its index (only values in the window)
+
+    Step i: check window → evict index i-k (slot i % k) → store value i
+
+No duplicate inside the window (we'd have stopped), so every value in
+the window is unique and eviction is a plain delete.
+"""
+
+def nearby_duplicate_pair(stream, k):
+    """
+    First pair (j, i) with stream[j] == stream[i] and i - j <= k
+
+    Args:
+        stream: any iterable (list, generator, file lines...)
+        k: maximum distance
+
+    Returns:
+        tuple: (j, i) or None
+
+    Time: O(n), Space: O(k) (never more than k values kept)
+    """
+    if k <= 0:
+        return None
+    ring = [None] * k
+    window = {}  # value → index, only for the last k items
+
+    for i, num in enumerate(stream):
+        if num in window:
+            return window[num], i
+        slot = i % k
+        if i >= k:
+            del window[ring[slot]]  # index i - k leaves the window
+        ring[slot] = num
+        window[num] = i
+
+    return None
+
+
+def contains_nearby_duplicate_bounded(stream, k):
+    """Same answer as contains_nearby_duplicate, O(k) memory"""
+    return nearby_duplicate_pair(stream, k) is not None
+
+# Test
+print("\nBounded window (reports the pair):")
+for nums, k in test_cases:
+    print(f"{nums}, k={k} → {nearby_duplicate_pair(nums, k)}")
+# (0, 3), (2, 3), None
+
+# Streaming: values arrive one line at a time
+import io
+log = io.StringIO("user7\nuser3\nuser9\nuser3\nuser1\n")
+print(f"Log stream, k=2 → {nearby_duplicate_pair((line.strip() for line in log), 2)}")
+# (1, 3): user3 at lines 1 and 3
+
+# ----------------------------------------------------------------------------
+# Variant: values within t of each other (|a - b| <= t) - bucketing
+# ----------------------------------------------------------------------------
+"""
+Buckets of width t:  bucket = value // t   (t = 0: the value itself)
+    same bucket           → difference < t for sure (still checked:
+                            float division can round across a boundary)
+    neighbour bucket ±1   → maybe, check the difference
+    further away          → difference > t, never a match
+Works for floats too (the classic width t + 1 is only safe for integers:
+1.2 and 1.7 share a width-1 bucket but differ by 0.5 > 0)
+
+Two window values in one bucket would already be a match, so each bucket
+holds at most one value: bucket → (value, index), evicted like above.
+"""
+
+def nearby_almost_duplicate_pair(stream, k, t):
+    """
+    First pair (j, i) with i - j <= k and |stream[i] - stream[j]| <= t
+
+    "First" = smallest i; if several j match that i, the nearest one
+    (largest j)
+
+    Args:
+        stream: iterable of numbers (ints or floats)
+        k: maximum index distance
+        t: maximum value difference (>= 0)
+
+    Returns:
+        tuple: (j, i) or None
+
+    Time: O(n), Space: O(k)
+    """
+    if k <= 0 or t < 0:
+        return None
+    ring = [None] * k
+    buckets = {}  # bucket id → (value, index)
+
+    for i, num in enumerate(stream):
+        bucket = num // t if t else num
+        matches = [
+            buckets[b][1]
+            for b in (bucket, bucket - 1, bucket + 1)
+            if b in buckets and abs(num - buckets[b][0]) <= t
+        ]
+        if matches:
+            return max(matches), i
+
+        slot = i % k
+        if i >= k and buckets.get(ring[slot], (None, -1))[1] == i - k:
+            del buckets[ring[slot]]  # not already replaced by a newer value
+        ring[slot] = bucket
+        buckets[bucket] = (num, i)
+
+    return None
+
+# Test
+print("\nValues within t (bucketed):")
+almost_cases = [
+    ([1, 2, 3, 1], 3, 0),        # (0, 3)
+    ([1, 0, 1, 1], 1, 2),        # (0, 1)
+    ([1, 5, 9, 1, 5, 9], 2, 3),  # None
+    ([8, -3, 14, 6], 3, 2),      # (0, 3): |8 - 6| = 2
+    ([1.2, 1.7], 1, 0),          # None: |1.2 - 1.7| = 0.5 > 0
+    ([20.5, 21.9, 21.2], 2, 0.75),  # (1, 2): 21.9 is nearer than 20.5
+]
+for nums, k, t in almost_cases:
+    print(f"{nums}, k={k}, t={t} → {nearby_almost_duplicate_pair(nums, k, t)}")
+
+# Memory: original `seen` vs bounded window on a long stream
+import tracemalloc
+
+def peak_memory(func, *args):
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+if __name__ == "__main__":
+    n, k = 200_000, 100
+    print(f"\nStream of {n:,} distinct values, k={k}:")
+    print(f"contains_nearby_duplicate peak:         {peak_memory(contains_nearby_duplicate, iter(range(n)), k) / 1e6:.2f} MB")
+    print(f"contains_nearby_duplicate_bounded peak: {peak_memory(contains_nearby_duplicate_bounded, iter(range(n)), k) / 1e6:.2f} MB")
+
 # ============================================================================
 # PROBLEM 7: COUNT DISTINCT ELEMENTS
 # ============================================================================
@@ -350,18 +498,128 @@ print("\n" + "="*60)
 print("PROBLEM 7: COUNT DISTINCT ELEMENTS")
 print("="*60)
 
-def count_distinct(nums):
+# ----------------------------------------------------------------------------
+# HyperLogLog: approximate distinct count in a few KB
+# ----------------------------------------------------------------------------
+"""
+A set of 2 billion events can take tens of GB. HyperLogLog keeps m small
+counters ("registers") instead:
+
+    hash(x) → 64 random-looking bits
+    first p bits   → which register (m = 2^p registers)
+    remaining bits → count leading zeros + 1 = "rank"
+    register = max(register, rank)
+
+Seeing a rank of r is like flipping r-1 tails in a row: it takes about 2^r
+distinct items. Averaging over m registers (harmonic mean) gives the
+estimate, with standard error ≈ 1.04 / √m  (p=14 → 16 KB, ≈ 0.8%)
+(Around 2.5·m distinct values the estimator switches from linear counting
+and can be biased by ~2%; HyperLogLog++ adds bias tables for that range)
+
+Hash must be STABLE: Python's hash() of str is salted per process, so
+sketches from different machines/runs couldn't be merged → blake2b
+"""
+
+import hashlib
+import math
+
+
+def stable_hash64(value):
+    """64-bit hash that is the same in every process and on every machine"""
+    if isinstance(value, bytes):
+        data = b"b" + value
+    elif isinstance(value, str):
+        data = b"s" + value.encode("utf-8")
+    elif isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+        data = b"n" + str(int(value)).encode()  # True == 1 == 1.0, like in a set
+    elif isinstance(value, float):
+        data = b"n" + repr(value).encode()
+    else:
+        data = b"r" + repr(value).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    Cardinality estimator with 2^precision one-byte registers
+
+    add: O(1), count: O(m), merge: O(m), memory: m bytes
+    """
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+
+    def add(self, value):
+        x = stable_hash64(value)
+        index = x >> (64 - self.precision)
+        rest = x & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values):
+        """Add every value of an iterable; returns self"""
+        for value in values:
+            self.add(value)
+        return self
+
+    def count(self):
+        """Estimated number of distinct values added"""
+        m = self.m
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+
+        # Small range: many empty registers → linear counting is better
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return estimate
+
+    def merge(self, other):
+        """Absorb a sketch of another shard (same precision); returns self"""
+        if other.precision != self.precision:
+            raise ValueError("can only merge sketches with the same precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def to_bytes(self):
+        """Serialize: 1 precision byte + the registers"""
+        return bytes([self.precision]) + bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data):
+        sketch = cls(data[0])
+        if len(data) != 1 + sketch.m:
+            raise ValueError("register array has the wrong size")
+        sketch.registers = bytearray(data[1:])
+        return sketch
+
+    def __len__(self):
+        return round(self.count())
+
+    def __repr__(self):
+        return f"HyperLogLog(precision={self.precision}, estimate={self.count():.0f})"
+
+
+def count_distinct(nums, approximate=False, precision=14):
     """
     Count number of unique elements
     
     Args:
-        nums: List of numbers
+        nums: List of numbers (any iterable when approximate=True)
+        approximate: use HyperLogLog (2^precision bytes) instead of a set
+        precision: HyperLogLog precision (error ≈ 1.04 / √(2^precision))
     
     Returns:
-        int: Count of distinct elements
+        int: Count of distinct elements (estimate if approximate)
     
-    Time: O(n), Space: O(k)
+    Time: O(n), Space: O(k) exact, O(2^precision) approximate
     """
+    if approximate:
+        return len(HyperLogLog(precision).update(nums))
     return len(set(nums))
 
 # Alternative with dictionary
@@ -385,6 +643,43 @@ for nums in test_cases:
     result2 = count_distinct_dict(nums)
     print(f"{nums} → Distinct: {result1} (verified: {result2})")
 
+# Approximate counting
+print("\nHyperLogLog (approximate=True):")
+events = [f"user{i % 30_000}" for i in range(100_000)]  # 30,000 distinct
+print(f"Exact:       {count_distinct(events)}")
+print(f"Approximate: {count_distinct(events, approximate=True)}")  # ≈ 30,000 (±1%)
+
+# Shards: sketch each part separately, merge (e.g. after sending bytes)
+left = HyperLogLog().update(events[:50_000])
+right = HyperLogLog.from_bytes(HyperLogLog().update(events[50_000:]).to_bytes())
+print(f"Merged shards: {len(left.merge(right))} ({len(left.to_bytes()):,} bytes per sketch)")
+
+
+def benchmark_hyperloglog(sizes=(1_000, 10_000, 100_000), precisions=(10, 12, 14), seed=31):
+    """
+    Relative error of HyperLogLog vs the exact set, per precision
+    Events repeat (each distinct value ~3 times) like a real stream
+    """
+    import random
+    import sys
+    rng = random.Random(seed)
+    print(f"{'distinct':>9} {'p':>3} {'estimate':>10} {'error':>8} {'expected':>9} {'sketch':>8} {'set':>10}")
+    for size in sizes:
+        stream = [rng.getrandbits(64) for _ in range(size)] * 3
+        rng.shuffle(stream)
+        exact = count_distinct(stream)
+        set_bytes = sys.getsizeof(set(stream))
+        for precision in precisions:
+            estimate = count_distinct(stream, approximate=True, precision=precision)
+            error = abs(estimate - exact) / exact
+            expected = 1.04 / math.sqrt(1 << precision)
+            print(f"{exact:>9,} {precision:>3} {estimate:>10,} {error:>8.2%} {expected:>9.2%} "
+                  f"{1 << precision:>7,}B {set_bytes:>9,}B")
+
+if __name__ == "__main__":
+    print("\nAccuracy benchmark:")
+    benchmark_hyperloglog()
+
 # ============================================================================
 # COMPARISON: DICTIONARY vs SET
 # ============================================================================
@@ -422,6 +717,7 @@ PATTERNS:
 3. All duplicates: count[num] > 1
 4. First unique: count[num] == 1 (maintain order!)
 5. Nearby duplicate: track indices in dict
+   (ring buffer + evicting window dict → O(k) memory, works on streams)
 
 OPTIMIZATION:
 ✓ Set is faster than dict for simple checks
@@ -432,7 +728,9 @@ COMMON VARIATIONS:
 ✓ Character vs number duplicates (same logic)
 ✓ Case-insensitive: text.lower() first
 ✓ Within K distance: track indices
+✓ Within K distance AND |a - b| <= t: buckets of width t
 ✓ Count distinct: len(set())
+✓ Count distinct on huge streams: HyperLogLog (KBs, ~1% error, mergeable)
 
 INTERVIEW TIPS:
 ✓ Always consider early return